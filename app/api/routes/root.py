@@ -1,23 +1,29 @@
 """Root API endpoint for version and status information."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.api.schemas.response import APIResponse
 from app.api.schemas.root import RootResponse
 
 router = APIRouter(prefix="/api", tags=["Default Endpoints"])
 
-
-@router.get("", response_model=APIResponse[RootResponse])
-async def root() -> APIResponse[RootResponse]:
-    """API root endpoint with version info."""
-    return APIResponse(
+# The payload never changes, so it is encoded once at import
+ROOT_RESPONSE = orjson.dumps(
+    APIResponse.model_construct(
         success=True,
         code="API_READY",
         message="API is ready",
-        data=RootResponse(
+        data=RootResponse.model_construct(
             status="ready",
             version="1.0.0",
             author="Matthias Truyzelaere",
         ),
-    )
+    ).model_dump()
+)
+
+
+@router.get("", response_model=APIResponse[RootResponse])
+async def root() -> Response:
+    """API root endpoint with version info."""
+    return Response(content=ROOT_RESPONSE, media_type="application/json")
@@ -1,6 +1,6 @@
 """Generic API response and error schema definitions."""
 
-from typing import Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from app.api.schemas.base import Schema
 
@@ -21,3 +21,9 @@ class APIError(Schema):
 
     code: str
     message: str
+
+
+class APIValidationError(APIError):
+    """Schema for request validation error responses with per-field details."""
+
+    errors: List[Dict[str, Any]]
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
         env_ignore_empty=True,
     )
 
+    env: str = "dev"
+
     allowed_origins: str
 
     ollama_base_url: str
@@ -24,6 +26,7 @@ class Settings(BaseSettings):
     chat_model: str
     embedding_model: str
     keep_alive: int
+    embed_tokens_per_batch: int = 8192
 
     postgres_user: str
     postgres_password: str
@@ -31,10 +34,19 @@ class Settings(BaseSettings):
     postgres_host: str
     postgres_port: str
 
+    db_pool_min: int = 4
+    db_pool_max: int = 32
+    db_pool_timeout: int = 5
+    db_pool_max_idle: int = 300
+    db_statement_timeout: int = 30
+    db_idle_tx_timeout: int = 10
+
     chunk_size: int
     chunk_size_min: int
     chunk_overlap: int
     retriever_k: int
+    hnsw_ef_search: int = 40
+    query_embed_cache: int = 1024
 
     data_path: str
     max_file_size: int
@@ -46,6 +58,8 @@ class Settings(BaseSettings):
     rate_limit_default: int
     rate_limit_default_window: int
 
+    redis_url: str | None = None
+
     @field_validator(
         "postgres_user", "postgres_password", "postgres_db", "postgres_host"
     )
@@ -0,0 +1,79 @@
+"""Request guard middleware for size limits, rate limiting and drain tracking."""
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.inflight import InflightTracker
+from app.core.ratelimit import RATE_LIMIT_EXCEEDED, take_token
+
+# Global request size limit, checked before any route reads the body
+SIZE_LIMIT = 210 * 1024 * 1024
+METHODS_WITH_BODY = frozenset(("POST", "PUT", "PATCH"))
+TOO_LARGE_BODY = orjson.dumps(
+    {"code": "PAYLOAD_TOO_LARGE", "message": "Request too large"}
+)
+
+# The 413 response is pre-encoded so rejecting repeated oversized requests
+# never builds a Response object. Closing the connection stops the client
+# streaming a body that is never read.
+TOO_LARGE_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(TOO_LARGE_BODY)).encode()),
+    (b"connection", b"close"),
+)
+
+
+async def send_too_large(send: Send) -> None:
+    """Send the pre-encoded 413 response."""
+    # Outer middleware such as CORS appends to the header list in place,
+    # so each response gets its own copy
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 413,
+            "headers": list(TOO_LARGE_HEADERS),
+        }
+    )
+    await send({"type": "http.response.body", "body": TOO_LARGE_BODY})
+
+
+class GuardMiddleware:
+    """
+    Pure ASGI middleware applying the global checks to every HTTP request.
+
+    Rejects bodies over the size limit, enforces the token bucket rate
+    limit and counts in-flight requests for graceful shutdown. Running
+    outside BaseHTTPMiddleware avoids a task group and memory stream per
+    request, and the in-flight count covers streamed response bodies.
+    """
+
+    def __init__(self, app: ASGIApp, inflight: InflightTracker) -> None:
+        self.app = app
+        self.inflight = inflight
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in METHODS_WITH_BODY:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if int(value) > SIZE_LIMIT:
+                        await send_too_large(send)
+                        return
+                    break
+
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        if not await take_token(ip, scope["path"]):
+            response = ORJSONResponse(status_code=429, content=RATE_LIMIT_EXCEEDED)
+            await response(scope, receive, send)
+            return
+
+        self.inflight.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.inflight.finish()
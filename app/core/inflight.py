@@ -0,0 +1,33 @@
+"""In-flight request tracking for graceful shutdown."""
+
+import asyncio
+
+
+class InflightTracker:
+    """Count requests being handled and signal when none remain."""
+
+    __slots__ = ("count", "_idle")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start(self) -> None:
+        """Record that a request has started."""
+        self.count += 1
+        self._idle.clear()
+
+    def finish(self) -> None:
+        """Record that a request has finished."""
+        self.count -= 1
+        if self.count == 0:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait until no requests are in flight, up to timeout seconds."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
@@ -21,13 +21,17 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: f"\t{BG}{WHITE} CRITICAL {RESET}",
     }
 
+    def __init__(self) -> None:
+        """Parse the format string once instead of per record."""
+        super().__init__(self.fmt)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colored badge."""
         record.level_badge = self.LEVEL_BADGES.get(
             record.levelno,
             f"[{record.levelname}]",
         )
-        return logging.Formatter(self.fmt).format(record)
+        return super().format(record)
 
 
 def setup_logger() -> None:
@@ -40,6 +44,11 @@ def setup_logger() -> None:
     root.handlers.clear()
     root.addHandler(handler)
 
+    # The format never shows process or thread info, so skip collecting it
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+
     # Reduce uvicorn log noise
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
@@ -1,11 +1,16 @@
 """Token bucket rate limiting middleware."""
 
-import time
+from collections import OrderedDict
+from time import monotonic_ns as _now
 
 from fastapi import HTTPException, Request, status
+from redis.exceptions import RedisError
 
 from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.infra.cache.connection import redis
 
+logger = get_logger(__name__)
 settings = get_settings()
 
 RATE_LIMITS = {
@@ -16,63 +21,141 @@ RATE_LIMITS = {
 DEFAULT_RATE_LIMIT = settings.rate_limit_default
 DEFAULT_WINDOW = settings.rate_limit_default_window
 
-buckets: dict[str, dict[str, dict[str, float]]] = {}
-last_cleanup = time.time()
-CLEANUP_INTERVAL = 300
+_DEFAULT = (DEFAULT_RATE_LIMIT, DEFAULT_WINDOW)
+_rate_get = RATE_LIMITS.get
 
+RATE_LIMIT_EXCEEDED = {
+    "code": "RATE_LIMIT_EXCEEDED",
+    "message": "Rate limit exceeded. Try again soon.",
+}
 
-def cleanup_old_buckets():
-    """Remove expired rate limit buckets to prevent memory leaks."""
-    global last_cleanup
-    now = time.time()
 
-    if now - last_cleanup < CLEANUP_INTERVAL:
-        return
+# Nanoseconds per second, for converting rate limit windows
+NS_PER_SECOND = 1_000_000_000
 
-    for ip in list(buckets.keys()):
-        for path in list(buckets[ip].keys()):
-            if now - buckets[ip][path]["timestamp"] > DEFAULT_WINDOW * 2:
-                del buckets[ip][path]
-        if not buckets[ip]:
-            del buckets[ip]
 
-    last_cleanup = now
+class Bucket:
+    """
+    Token bucket state for a single client and path.
 
+    Tokens are stored as integers scaled by the window in nanoseconds, so
+    one token is window_ns units and each elapsed nanosecond refills limit
+    units. This keeps refills exact without float division.
+    """
+
+    __slots__ = ("tokens", "timestamp")
+
+    def __init__(self, tokens: int, timestamp: int) -> None:
+        self.tokens = tokens
+        self.timestamp = timestamp
+
+
+# Least recently used buckets are evicted once the cap is reached, which
+# bounds memory when clients spoof many source addresses
+MAX_BUCKETS = 50_000
+
+buckets: OrderedDict[tuple[str, str], Bucket] = OrderedDict()
 
-async def rate_limit(request: Request, call_next):
-    """Token bucket rate limiter that refills tokens over time."""
-    cleanup_old_buckets()
 
-    ip = request.client.host
-    path = request.url.path
-    now = time.time()
+# Refill and consume atomically in Redis so every worker shares one bucket.
+# Uses the Redis clock because worker monotonic clocks are not comparable
+# across hosts. Returns 1 when a token was taken, 0 when the bucket is empty.
+TOKEN_BUCKET_LUA = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
 
-    limit, window = RATE_LIMITS.get(path, (DEFAULT_RATE_LIMIT, DEFAULT_WINDOW))
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(bucket[1]) or limit
+local timestamp = tonumber(bucket[2]) or now
 
-    if ip not in buckets:
-        buckets[ip] = {}
+tokens = math.min(limit, tokens + (now - timestamp) * (limit / window))
 
-    if path not in buckets[ip]:
-        buckets[ip][path] = {"tokens": limit, "timestamp": now}
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
 
-    bucket = buckets[ip][path]
-    elapsed = now - bucket["timestamp"]
+redis.call("HSET", KEYS[1], "tokens", tokens, "timestamp", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(window * 2))
+return allowed
+"""
 
-    bucket["tokens"] = min(
-        limit,
-        bucket["tokens"] + elapsed * (limit / window),
-    )
-    bucket["timestamp"] = now
+token_bucket = redis.register_script(TOKEN_BUCKET_LUA) if redis else None
 
-    if bucket["tokens"] < 1:
+# Set while Redis is failing, so the outage is logged only once
+_redis_down = False
+
+
+async def load_rate_limit_script() -> None:
+    """Preload the token bucket script so requests only send EVALSHA."""
+    if redis is None:
+        return
+    try:
+        await redis.script_load(TOKEN_BUCKET_LUA)
+    except RedisError as e:
+        logger.warning(f"Failed to preload rate limit script: {e}")
+
+
+def take_local_token(ip: str, path: str, now: int, limit: int, window: int) -> bool:
+    """Refill and consume a token from the in-process bucket at now (in ns)."""
+    one_token = window * NS_PER_SECOND
+    capacity = limit * one_token
+
+    key = (ip, path)
+    bucket = buckets.get(key)
+    if bucket is None:
+        if len(buckets) >= MAX_BUCKETS:
+            buckets.popitem(last=False)
+        bucket = Bucket(capacity, now)
+        buckets[key] = bucket
+    else:
+        buckets.move_to_end(key)
+
+    tokens = min(capacity, bucket.tokens + (now - bucket.timestamp) * limit)
+    allowed = tokens >= one_token
+    bucket.tokens = tokens - one_token * allowed
+    bucket.timestamp = now
+    return allowed
+
+
+async def take_token(ip: str, path: str) -> bool:
+    """
+    Consume a token for the client and path, returning whether it was allowed.
+
+    Uses Redis when configured so limits hold across workers, and falls
+    back to in-process buckets otherwise or when Redis is unreachable.
+    """
+    global _redis_down
+    limit, window = _rate_get(path, _DEFAULT)
+
+    if token_bucket is not None:
+        try:
+            allowed = bool(
+                await token_bucket(keys=[f"rl:{ip}:{path}"], args=[limit, window])
+            )
+        except RedisError as e:
+            # Warn once per outage instead of on every request while it lasts
+            if not _redis_down:
+                _redis_down = True
+                logger.warning(f"Redis rate limit failed, using local buckets: {e}")
+        else:
+            if _redis_down:
+                _redis_down = False
+                logger.info("Redis rate limit recovered")
+            return allowed
+
+    return take_local_token(ip, path, _now(), limit, window)
+
+
+async def rate_limit(request: Request, call_next):
+    """Token bucket rate limiter that refills tokens over time."""
+    if not await take_token(request.client.host, request.url.path):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "code": "RATE_LIMIT_EXCEEDED",
-                "message": "Rate limit exceeded. Try again soon.",
-            },
+            detail=RATE_LIMIT_EXCEEDED,
         )
 
-    bucket["tokens"] -= 1
-
     return await call_next(request)
@@ -1,7 +1,10 @@
 """Document loading for various file formats."""
 
+import multiprocessing
 import os
-from typing import List
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Tuple
 
 from langchain_core.documents import Document
 from langchain_unstructured import UnstructuredLoader
@@ -9,34 +12,88 @@ from pypdf import PdfReader
 from unstructured.cleaners.core import clean_extra_whitespace
 
 from app.core.logger import get_logger
+from app.domain.documents.pdf_pages import extract_page_range, open_pdf
 
 logger = get_logger(__name__)
 
+# PDFs up to this many pages are extracted in-process; larger ones are split
+# into page ranges of this size and extracted in parallel worker processes
+PARALLEL_PAGE_THRESHOLD = 16
+PAGES_PER_TASK = 16
+
+
+_pdf_executor: ProcessPoolExecutor | None = None
+_pdf_executor_lock = threading.Lock()
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """
+    Get shared process pool for CPU-bound PDF text extraction.
+
+    First use happens in upload worker threads, so creation is locked to
+    keep concurrent uploads from each starting a pool.
+    """
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            _pdf_executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_executor
+
+
+def close_pdf_executor() -> None:
+    """Shut down the PDF extraction pool during shutdown, if it was started."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is not None:
+            _pdf_executor.shutdown(cancel_futures=True)
+            _pdf_executor = None
+
+
+def extract_pdf_pages(path: str, reader: PdfReader) -> Iterable[Tuple[int, str]]:
+    """
+    Extract page texts in order, in parallel for large PDFs.
+
+    pypdf's extraction is pure Python, so worker processes are used to
+    sidestep the GIL once the page count outweighs the dispatch cost.
+    """
+    num_pages = len(reader.pages)
+    if num_pages <= PARALLEL_PAGE_THRESHOLD:
+        return ((i, page.extract_text()) for i, page in enumerate(reader.pages))
+
+    starts = range(0, num_pages, PAGES_PER_TASK)
+    stops = [min(start + PAGES_PER_TASK, num_pages) for start in starts]
+    results = get_pdf_executor().map(
+        extract_page_range, [path] * len(stops), starts, stops
+    )
+    return (page for batch in results for page in batch)
+
 
 def load_pdf(path: str) -> List[Document]:
     """Extract text from PDF files page by page."""
     name = os.path.basename(path)
-    reader = PdfReader(path)
     docs: List[Document] = []
 
-    for i, page in enumerate(reader.pages):
-        text = page.extract_text()
-        if not text:
-            continue
-        text = text.strip()
-        if len(text) < 10:
-            continue
-        docs.append(
-            Document(
-                page_content=text,
-                metadata={
-                    "source": path,
-                    "page": i + 1,
-                    "category": "PDFPage",
-                    "filename": name,
-                },
+    with open_pdf(path) as reader:
+        for i, text in extract_pdf_pages(path, reader):
+            if not text:
+                continue
+            text = text.strip()
+            if len(text) < 10:
+                continue
+            docs.append(
+                Document(
+                    page_content=text,
+                    metadata={
+                        "source": path,
+                        "page": i + 1,
+                        "category": "PDFPage",
+                        "filename": name,
+                    },
+                )
             )
-        )
     return docs
 
 
@@ -0,0 +1,32 @@
+"""PDF page text extraction shared with worker processes."""
+
+import mmap
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from pypdf import PdfReader
+
+
+@contextmanager
+def open_pdf(path: str) -> Iterator[PdfReader]:
+    """
+    Open a PDF reader backed by a read-only memory map of the file.
+
+    pypdf copies the whole file into a BytesIO when given a path; the
+    memory map lets it parse straight from the kernel page cache.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield PdfReader(mm, strict=False)
+
+
+def extract_page_range(path: str, start: int, stop: int) -> List[Tuple[int, str]]:
+    """
+    Extract text for pages in [start, stop) as (page_index, text) pairs.
+
+    Each worker opens its own reader because pypdf readers cannot be
+    shared across processes. Kept free of heavy imports so spawned
+    workers start quickly.
+    """
+    with open_pdf(path) as reader:
+        return [(i, reader.pages[i].extract_text() or "") for i in range(start, stop)]
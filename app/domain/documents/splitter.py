@@ -1,5 +1,7 @@
 """Document splitting with adaptive chunk sizing."""
 
+from functools import lru_cache
+from itertools import chain
 from typing import List
 
 from langchain_core.documents import Document
@@ -13,6 +15,20 @@ BASE_CHUNK = settings.chunk_size
 MIN_CHARS = settings.chunk_size_min
 OVERLAP = settings.chunk_overlap
 
+SEPARATORS = (
+    "\n\n## ",
+    "\n\n### ",
+    "\n\n",
+    "\n",
+    ". ",
+    "! ",
+    "? ",
+    "; ",
+    ", ",
+    " ",
+    "",
+)
+
 
 def choose_chunk_size(length: int, base: int = BASE_CHUNK) -> int:
     """
@@ -28,6 +44,33 @@ def choose_chunk_size(length: int, base: int = BASE_CHUNK) -> int:
     return max(int(base * 0.6), 400)
 
 
+@lru_cache(maxsize=8)
+def get_splitter(size: int, overlap: int) -> RecursiveCharacterTextSplitter:
+    """
+    Get cached text splitter for the given chunk size and overlap.
+
+    choose_chunk_size only yields a few distinct sizes, so one splitter
+    per size is reused across documents instead of rebuilt each time.
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=size,
+        chunk_overlap=overlap,
+        separators=list(SEPARATORS),
+        is_separator_regex=False,
+    )
+
+
+def _split_one(doc: Document, base_chunk_size: int, overlap: int) -> List[Document]:
+    """Split a single document, keeping it whole if it already fits."""
+    text = doc.page_content
+    size = choose_chunk_size(len(text), base_chunk_size)
+
+    if len(text) <= size * 0.8:
+        return [doc]
+
+    return get_splitter(size, overlap).split_documents([doc])
+
+
 def split_documents(
     docs: List[Document],
     base_chunk_size: int = BASE_CHUNK,
@@ -43,46 +86,13 @@ def split_documents(
     if not docs:
         return []
 
-    filtered: List[Document] = []
     for d in docs:
-        text = (d.page_content or "").strip()
-        if len(text) >= min_chars:
-            d.page_content = text
-            filtered.append(d)
+        d.page_content = (d.page_content or "").strip()
 
-    if not filtered:
-        return []
+    filtered = [d for d in docs if len(d.page_content) >= min_chars]
 
-    out: List[Document] = []
-
-    for doc in filtered:
-        text = doc.page_content or ""
-        size = choose_chunk_size(len(text), base_chunk_size)
-
-        if len(text) <= size * 0.8:
-            out.append(doc)
-            continue
-
-        splitter = RecursiveCharacterTextSplitter(
-            chunk_size=size,
-            chunk_overlap=overlap,
-            length_function=len,
-            separators=[
-                "\n\n## ",
-                "\n\n### ",
-                "\n\n",
-                "\n",
-                ". ",
-                "! ",
-                "? ",
-                "; ",
-                ", ",
-                " ",
-                "",
-            ],
-            is_separator_regex=False,
+    return list(
+        chain.from_iterable(
+            _split_one(doc, base_chunk_size, overlap) for doc in filtered
         )
-
-        out.extend(splitter.split_documents([doc]))
-
-    return out
+    )
@@ -11,8 +11,6 @@ from app.core.logger import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
-_warmed_up = False
-
 
 @lru_cache(maxsize=1)
 def get_embedding_function() -> OllamaEmbeddings:
@@ -22,7 +20,6 @@ def get_embedding_function() -> OllamaEmbeddings:
     Warms up the model on first call to reduce latency on
     subsequent embedding requests.
     """
-    global _warmed_up
     model = settings.embedding_model
     base_url = settings.ollama_base_url
     keep_alive = settings.keep_alive
@@ -34,10 +31,8 @@ def get_embedding_function() -> OllamaEmbeddings:
             keep_alive=keep_alive,
         )
 
-        if not _warmed_up:
-            embeddings.embed_query("warmup")
-            _warmed_up = True
-            logger.info(f"Embedding model {model} warmed up successfully")
+        embeddings.embed_query("warmup")
+        logger.info(f"Embedding model {model} warmed up successfully")
 
         return embeddings
     except Exception as e:
@@ -1,12 +1,15 @@
-"""Document retrieval using hybrid search (semantic + BM25)."""
+"""Document retrieval using hybrid search (semantic + full-text)."""
 
+import io
 import os
 import re
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from langchain_community.retrievers import BM25Retriever
-from langchain_core.documents import Document
-from pgvector.psycopg import Vector, register_vector
+import numpy as np
+from pgvector.psycopg import Vector
 
 from app.core.config import get_settings
 from app.core.logger import get_logger
@@ -16,21 +19,63 @@ from app.infra.database.connection import pool
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Rank constant from the original RRF paper; damps the weight of top ranks so
+# a chunk found by both searches beats one ranked first by only one of them
+RRF_K = 60
+
+PERCENT_SPACING_PATTERN = re.compile(r"(\d+)\s+%")
+
 
 def fix_percent_spacing(text: str) -> str:
     """Fix spacing around percentage symbols (e.g., '50 %' -> '50%')."""
-    return re.sub(r"(\d+)\s+%", r"\1%", text)
+    # Runs on every streamed token, most of which contain no percent sign
+    if "%" not in text:
+        return text
+    return PERCENT_SPACING_PATTERN.sub(r"\1%", text)
 
 
-def semantic_search(
-    query: str, k: int, document_id: str | None = None
-) -> List[Document]:
-    """Search for documents using vector similarity."""
+@dataclass(slots=True)
+class Chunk:
+    """
+    Retrieved chunk text and metadata.
+
+    Exposes the same page_content and metadata attributes as a LangChain
+    Document without running Pydantic validation for every fetched row.
+    """
+
+    page_content: str
+    metadata: dict
+
+
+def _row_to_chunk(row: tuple) -> Chunk:
+    """Convert a chunk row into a Chunk carrying its ids in metadata."""
+    chunk_id, doc_id, idx, content, metadata = row
+    m = metadata or {}
+    m["id"] = chunk_id
+    m["document_id"] = doc_id
+    m["chunk_index"] = idx
+    return Chunk(content, m)
+
+
+def _rows_to_chunks(rows: List[tuple]) -> List[Chunk]:
+    """Convert chunk rows into Chunks carrying their ids in metadata."""
+    return [_row_to_chunk(row) for row in rows]
+
+
+@lru_cache(maxsize=settings.query_embed_cache)
+def _embed_query_cached(query: str) -> tuple[float, ...]:
+    """Embed a query string, reusing results for repeated queries."""
     embed = get_embedding_function()
-    vector = Vector(embed.embed_query(query))
+    return tuple(embed.embed_query(query))
 
+
+def semantic_search(query: str, k: int, document_id: str | None = None) -> List[Chunk]:
+    """Search for documents using vector similarity."""
+    vector = Vector(np.asarray(_embed_query_cached(query), dtype=np.float32))
+
+    # Cosine distance matches the vector_cosine_ops HNSW index, and prepared
+    # statements let each pooled connection plan the query only once
     with pool.connection() as conn:
-        register_vector(conn)
         with conn.cursor() as cur:
             if document_id:
                 # Search only within specific document
@@ -39,10 +84,11 @@ def semantic_search(
                     SELECT id, document_id, chunk_index, content, metadata
                     FROM document_chunks
                     WHERE document_id = %s
-                    ORDER BY embedding <-> %s
+                    ORDER BY embedding <=> %s
                     LIMIT %s
                     """,
                     (document_id, vector, k),
+                    prepare=True,
                 )
             else:
                 # Search across all documents
@@ -50,27 +96,27 @@ def semantic_search(
                     """
                     SELECT id, document_id, chunk_index, content, metadata
                     FROM document_chunks
-                    ORDER BY embedding <-> %s
+                    ORDER BY embedding <=> %s
                     LIMIT %s
                     """,
                     (vector, k),
+                    prepare=True,
                 )
             rows = cur.fetchall()
 
-    results: List[Document] = []
-    for chunk_id, doc_id, idx, content, metadata in rows:
-        m = metadata or {}
-        m["id"] = chunk_id
-        m["document_id"] = doc_id
-        m["chunk_index"] = idx
-        results.append(Document(page_content=content, metadata=m))
-    return results
+    return _rows_to_chunks(rows)
 
 
-def get_all_document_chunks(document_id: str) -> List[Document]:
-    """Retrieve all chunks for a specific document ordered by chunk index."""
+def iter_document_chunks(document_id: str) -> Iterator[Chunk]:
+    """
+    Yield all chunks for a specific document ordered by chunk index.
+
+    Uses a server-side cursor so rows are fetched in batches as the caller
+    consumes them, instead of loading the whole document into memory.
+    """
     with pool.connection() as conn:
-        with conn.cursor() as cur:
+        with conn.cursor(name="document_chunks_stream") as cur:
+            cur.itersize = 64
             cur.execute(
                 """
                 SELECT id, document_id, chunk_index, content, metadata
@@ -80,38 +126,113 @@ def get_all_document_chunks(document_id: str) -> List[Document]:
                 """,
                 (document_id,),
             )
+            for row in cur:
+                yield _row_to_chunk(row)
+
+
+@lru_cache(maxsize=1)
+def get_search_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool that runs full-text searches."""
+    return ThreadPoolExecutor(thread_name_prefix="lexical-search")
+
+
+def lexical_search(query: str, k: int, document_id: str | None = None) -> List[Chunk]:
+    """
+    Search for documents using PostgreSQL full-text ranking.
+
+    Query terms are OR-ed together so chunks matching only some of the
+    words still rank, which suits natural language questions.
+    """
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            if document_id:
+                # Search only within specific document
+                cur.execute(
+                    """
+                    SELECT c.id, c.document_id, c.chunk_index, c.content, c.metadata
+                    FROM document_chunks c,
+                        to_tsquery(
+                            'simple', replace(plainto_tsquery('simple', %s)::text, '&', '|')
+                        ) q
+                    WHERE c.document_id = %s AND c.content_tsv @@ q
+                    ORDER BY ts_rank_cd(c.content_tsv, q) DESC
+                    LIMIT %s
+                    """,
+                    (query, document_id, k),
+                    prepare=True,
+                )
+            else:
+                # Search across all documents
+                cur.execute(
+                    """
+                    SELECT c.id, c.document_id, c.chunk_index, c.content, c.metadata
+                    FROM document_chunks c,
+                        to_tsquery(
+                            'simple', replace(plainto_tsquery('simple', %s)::text, '&', '|')
+                        ) q
+                    WHERE c.content_tsv @@ q
+                    ORDER BY ts_rank_cd(c.content_tsv, q) DESC
+                    LIMIT %s
+                    """,
+                    (query, k),
+                    prepare=True,
+                )
             rows = cur.fetchall()
 
-    results: List[Document] = []
-    for chunk_id, doc_id, idx, content, metadata in rows:
-        m = metadata or {}
-        m["id"] = chunk_id
-        m["document_id"] = doc_id
-        m["chunk_index"] = idx
-        results.append(Document(page_content=content, metadata=m))
-    return results
+    return _rows_to_chunks(rows)
+
+
+def hybrid_search(query: str, k: int, document_id: str | None = None) -> List[Chunk]:
+    """
+    Combine semantic and full-text search with Reciprocal Rank Fusion.
+
+    Both searches run concurrently and every chunk scores 1 / (RRF_K + rank)
+    for each result list it appears in. The top k fused chunks are returned.
+    """
+    lexical = get_search_executor().submit(lexical_search, query, k, document_id)
+    ranked_lists = (semantic_search(query, k, document_id), lexical.result())
+
+    scores: Dict[str, float] = {}
+    chunks: Dict[str, Chunk] = {}
+    for results in ranked_lists:
+        for rank, doc in enumerate(results, 1):
+            chunk_id = str(doc.metadata["id"])
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (RRF_K + rank)
+            chunks.setdefault(chunk_id, doc)
+
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [chunks[chunk_id] for chunk_id in ranked[:k]]
+
 
+def build_context_into(buf: io.StringIO, chunks: Iterable[Chunk]) -> int:
+    """
+    Write retrieved chunks into a context buffer.
 
-def hybrid_search(query: str, k: int, document_id: str | None = None) -> List[Document]:
-    """Combine semantic search with BM25 for better retrieval."""
-    semantic = semantic_search(query, k, document_id)
-    if not semantic:
-        return []
-    return BM25Retriever.from_documents(semantic, k=k).invoke(query)
+    Headers and chunk contents are written straight into the buffer, so
+    chunk text is copied once and chunks can be consumed lazily.
+    Returns the number of chunks written.
+    """
+    count = 0
+    for count, doc in enumerate(chunks, 1):
+        if count > 1:
+            buf.write("\n\n---\n\n")
+        buf.write(f"[Chunk {count}]\n")
+        buf.write(doc.page_content)
+    return count
 
 
-def build_context(chunks: List[Document]) -> str:
+def build_context(chunks: Iterable[Chunk]) -> str:
     """Format retrieved chunks into a single context string."""
-    parts = []
-    for i, doc in enumerate(chunks, 1):
-        parts.append(f"[Chunk {i}]\n{doc.page_content}")
-    return "\n\n---\n\n".join(parts)
+    buf = io.StringIO()
+    build_context_into(buf, chunks)
+    return buf.getvalue()
 
 
-def extract_sources(chunks: List[Document]) -> List[str]:
-    """Extract source references from chunk metadata."""
-    out: List[str] = []
-    for meta in [c.metadata or {} for c in chunks]:
+def extract_sources(chunks: List[Chunk]) -> List[Tuple[str, int, int]]:
+    """Extract (filename, page, chunk index) source references from chunk metadata."""
+    out: List[Tuple[str, int, int]] = []
+    for chunk in chunks:
+        meta = chunk.metadata or {}
         source = meta.get("source", "")
         page = meta.get("page", 0)
         idx = meta.get("chunkIndex", 0)
@@ -124,5 +245,5 @@ def extract_sources(chunks: List[Document]) -> List[str]:
             idx = int(idx)
         except Exception:
             idx = 0
-        out.append(f"{name}:{page}:{idx}")
+        out.append((name, page, idx))
     return out
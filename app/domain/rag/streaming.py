@@ -1,6 +1,6 @@
 """Streaming response generation for RAG and summarization."""
 
-import os
+import io
 import time
 from typing import Generator
 
@@ -11,40 +11,32 @@ from app.domain.rag.model import get_chat_model
 from app.domain.rag.prompts import get_rag_chat_template, get_summary_template
 from app.domain.rag.retrieval import (
     build_context,
+    build_context_into,
     extract_sources,
     fix_percent_spacing,
-    get_all_document_chunks,
     hybrid_search,
+    iter_document_chunks,
 )
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
-def format_sources(sources: list[str]) -> str:
+def format_sources(sources: list[tuple[str, int, int]]) -> str:
     """
-    Format sources to show only filename and chunk info.
+    Format sources as comma-separated filename and chunk info.
 
     Args:
-        sources: List of source strings in format "path:page:chunk"
+        sources: List of (filename, page, chunk) tuples from extract_sources
 
     Returns:
-        Comma-separated formatted sources with filename only
+        Comma-separated formatted sources
 
     Example:
-        ["/data/doc.pdf:1:0", "/data/doc.pdf:2:1"]
+        [("doc.pdf", 1, 0), ("doc.pdf", 2, 1)]
         -> "doc.pdf:1:0, doc.pdf:2:1"
     """
-    formatted = []
-    for source in sources:
-        parts = source.split(":")
-        if len(parts) >= 3:
-            filename = os.path.basename(parts[0])
-            formatted.append(f"{filename}:{parts[1]}:{parts[2]}")
-        else:
-            filename = os.path.basename(source)
-            formatted.append(filename)
-    return ", ".join(formatted)
+    return ", ".join(f"{name}:{page}:{idx}" for name, page, idx in sources)
 
 
 def stream_rag(
@@ -86,18 +78,20 @@ def stream_rag(
     logger.info(f"Query received: {truncated_query}")
     logger.info(f"Sources: [{formatted_sources}]")
 
-    # Build context and prompt
+    # Time from here so first-token latency includes prompt building
+    start = time.perf_counter()
+
+    # Build context and structured prompt messages
     context = build_context(results)
     prompt_template = get_rag_chat_template()
-    prompt = prompt_template.format(context=context, query=query)
+    messages = prompt_template.format_messages(context=context, query=query)
 
     # Stream LLM response and track metrics
-    start = time.perf_counter()
     first = None
     total = 0
     ttft = 0.0
 
-    for chunk in model.stream(prompt):
+    for chunk in model.stream(messages):
         text = getattr(chunk, "content", None)
         if not text:
             continue
@@ -139,30 +133,34 @@ def stream_summary(
     """
     model = get_chat_model()
 
-    # Retrieve all document chunks
-    chunks = get_all_document_chunks(document_id)
+    # Stream document chunks from the database straight into the context
+    fetch_start = time.perf_counter()
+    buf = io.StringIO()
+    count = build_context_into(buf, iter_document_chunks(document_id))
+    fetch_time = time.perf_counter() - fetch_start
 
     logger.info(
-        f"Summary request: Document ID={document_id} | Length={length.value} | Chunks={len(chunks)}"
+        f"Summary request: Document ID={document_id} | Length={length.value} | Chunks={count} | Fetch Time={fetch_time:.2f}s"
     )
 
-    if not chunks:
+    if not count:
         logger.info(f"No chunks found for document: {document_id}")
         yield "Unable to generate summary: no content found for this document."
         return
 
-    # Build context and prompt
-    context = build_context(chunks)
+    # Time from here, after the database fetch, so metrics match stream_rag
+    start = time.perf_counter()
+
+    # Build structured prompt messages
     summary_template = get_summary_template(length)
-    prompt = summary_template.format(context=context)
+    messages = summary_template.format_messages(context=buf.getvalue())
 
     # Stream summary and track metrics
-    start = time.perf_counter()
     first = None
     total = 0
     ttft = 0.0
 
-    for chunk in model.stream(prompt):
+    for chunk in model.stream(messages):
         text = getattr(chunk, "content", None)
         if not text:
             continue
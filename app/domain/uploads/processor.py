@@ -1,5 +1,7 @@
 """File upload processing with validation and indexing."""
 
+import asyncio
+import hashlib
 import re
 from pathlib import Path
 from typing import List, Tuple
@@ -15,10 +17,9 @@ from app.core.exceptions import (
     InvalidFileTypeError,
 )
 from app.core.logger import get_logger
-from app.domain.documents.hashing import compute_file_hash
 from app.domain.documents.loader import load_document
 from app.domain.documents.splitter import split_documents
-from app.infra.database.queries import index_chunks
+from app.infra.database.queries import get_document_by_hash, index_chunks
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -28,6 +29,11 @@ ALLOWED_EXT = {".txt", ".rtf", ".doc", ".docx", ".pdf", ".ppt", ".pptx"}
 BASE_UPLOAD_DIR = Path(settings.data_path)
 MAX_FILE_SIZE = settings.max_file_size
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+PATH_SEPARATORS = str.maketrans({"/": "_", "\\": "_"})
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\s.-]")
+
 
 def ensure_dir(path: Path) -> None:
     """Create directory if it doesn't exist."""
@@ -41,24 +47,44 @@ def validate_extension(name: str) -> bool:
 
 def sanitize_filename(name: str) -> str:
     """Remove dangerous characters from filename."""
-    name = name.strip()
-    name = name.replace("..", "")
-    name = name.replace("/", "_")
-    name = name.replace("\\", "_")
-    name = re.sub(r"[^\w\s.-]", "", name)
-    name = name[:255]
-    return name
+    name = name.strip().replace("..", "")
+    name = name.translate(PATH_SEPARATORS)
+    name = UNSAFE_FILENAME_CHARS.sub("", name)
+    return name[:255]
+
+
+async def hash_upload(file: UploadFile) -> Tuple[str, int]:
+    """
+    Compute the SHA-256 content hash and size of an upload before saving.
+
+    Reads the spooled upload in chunks and rewinds it afterwards, so
+    duplicates can be rejected without writing anything to disk. Uploads
+    over MAX_FILE_SIZE are rejected as soon as the running size exceeds it.
+    Returns (content_hash, file_size).
+    """
+    hasher = hashlib.sha256()
+    file_size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        file_size += len(chunk)
+        if file_size > MAX_FILE_SIZE:
+            max_mb = MAX_FILE_SIZE / (1024 * 1024)
+            raise FileTooLargeError(
+                f"File size exceeds maximum allowed size of {max_mb:.1f} MB."
+            )
+        hasher.update(chunk)
+    await file.seek(0)
+    return hasher.hexdigest(), file_size
 
 
 async def save_upload(file: UploadFile) -> Path:
-    """Save uploaded file to disk asynchronously."""
+    """Save uploaded file to disk asynchronously in chunks."""
     ensure_dir(BASE_UPLOAD_DIR)
     sanitized_name = sanitize_filename(file.filename)
     dest = BASE_UPLOAD_DIR / sanitized_name
 
-    content = await file.read()
     async with aiofiles.open(dest, "wb") as buffer:
-        await buffer.write(content)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
 
     return dest
 
@@ -81,19 +107,25 @@ async def process_upload(file: UploadFile) -> Tuple[str, int, str]:
             f"Only files with extensions {allowed} are supported."
         )
 
-    file.file.seek(0, 2)
-    file_size = file.file.tell()
-    file.file.seek(0)
-
-    if file_size > MAX_FILE_SIZE:
-        max_mb = MAX_FILE_SIZE / (1024 * 1024)
-        raise FileTooLargeError(
-            f"File size exceeds maximum allowed size of {max_mb:.1f} MB."
-        )
+    content_hash, file_size = await hash_upload(file)
 
     if file_size == 0:
         raise InvalidFileTypeError("File is empty.")
 
+    try:
+        existing_id = await asyncio.to_thread(get_document_by_hash, content_hash)
+    except Exception as e:
+        logger.error(f"Failed to check for duplicate upload: {e}")
+        raise DocumentProcessingError(f"Failed to check for duplicate upload: {e}")
+
+    if existing_id:
+        logger.info(
+            "Skipped saving %s (already indexed as document %s)",
+            sanitized_filename,
+            existing_id,
+        )
+        return existing_id, 0, sanitized_filename
+
     try:
         path = await save_upload(file)
     except Exception as e:
@@ -103,16 +135,16 @@ async def process_upload(file: UploadFile) -> Tuple[str, int, str]:
     try:
         filename = sanitized_filename
         file_type = Path(filename).suffix.lower().lstrip(".") or "unknown"
-        actual_file_size = path.stat().st_size
-        content_hash = compute_file_hash(str(path))
 
-        docs: List[Document] = load_document(str(path))
+        # Parsing and indexing block, so they run off the event loop
+        docs: List[Document] = await asyncio.to_thread(load_document, str(path))
         chunks = split_documents(docs)
 
-        document_id, count = index_chunks(
+        document_id, count = await asyncio.to_thread(
+            index_chunks,
             filename=filename,
             file_type=file_type,
-            file_size=actual_file_size,
+            file_size=file_size,
             content_hash=content_hash,
             chunks=chunks,
         )
@@ -0,0 +1,27 @@
+"""Redis connection for state shared across application workers."""
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Redis sits on every request's path through the rate limiter, so a stalled
+# server must fail fast and let callers fall back instead of hanging
+REDIS_TIMEOUT = 0.05
+
+redis = (
+    Redis.from_url(
+        settings.redis_url,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT,
+    )
+    if settings.redis_url
+    else None
+)
+
+
+async def close_redis():
+    """Close the Redis connection pool during shutdown."""
+    if redis:
+        await redis.aclose()
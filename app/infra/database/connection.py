@@ -2,6 +2,10 @@
 
 from urllib.parse import quote_plus
 
+import orjson
+from pgvector.psycopg import register_vector
+from psycopg import Connection
+from psycopg.types.json import set_json_dumps, set_json_loads
 from psycopg_pool import ConnectionPool
 
 from app.core.config import get_settings
@@ -27,11 +31,40 @@ db = quote_plus(settings.postgres_db)
 
 DATABASE_URL = f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
+
+def configure_connection(conn: Connection) -> None:
+    """
+    Prepare a new pooled connection for vector queries.
+
+    Registers the pgvector adapters and sets the HNSW search breadth once
+    per connection, so queries no longer repeat the type introspection.
+    JSON is encoded and decoded with orjson, which produces bytes directly
+    instead of a str that psycopg has to encode again.
+    """
+    register_vector(conn)
+    set_json_dumps(orjson.dumps, conn)
+    set_json_loads(orjson.loads, conn)
+    conn.execute(f"SET hnsw.ef_search = {int(settings.hnsw_ef_search)}")
+    conn.commit()
+
+
 pool = ConnectionPool(
     conninfo=DATABASE_URL,
-    min_size=1,
-    max_size=10,
-    timeout=10,
+    min_size=settings.db_pool_min,
+    max_size=settings.db_pool_max,
+    timeout=settings.db_pool_timeout,
+    max_idle=settings.db_pool_max_idle,
+    configure=configure_connection,
+    # Keepalives detect dead peers, and server-side timeouts stop a stuck
+    # statement or abandoned transaction from holding a pool slot forever
+    kwargs={
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "options": (
+            f"-c statement_timeout={settings.db_statement_timeout * 1000} "
+            f"-c idle_in_transaction_session_timeout={settings.db_idle_tx_timeout * 1000}"
+        ),
+    },
     open=True,
 )
 
@@ -1,66 +1,160 @@
 """Database queries for document and chunk management."""
 
-import json
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+from cachetools import TTLCache
 from langchain_core.documents import Document
+from psycopg import Cursor
+from psycopg.types.json import Jsonb
 
+from app.core.config import get_settings
 from app.core.exceptions import DatabaseError, EmbeddingError
 from app.core.logger import get_logger
 from app.domain.embeddings.provider import get_embedding_function
 from app.infra.database.connection import pool
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Upper bound on embedding requests in flight for a single document
+EMBED_MAX_WORKERS = 8
+
+# Only confirmed documents are cached, so a freshly uploaded document is
+# never reported missing; deletions evict their entry immediately
+_existing_documents: TTLCache[str, bool] = TTLCache(maxsize=4096, ttl=30.0)
+_document_ids_by_hash: TTLCache[str, str] = TTLCache(maxsize=2048, ttl=30.0)
+
+# Queries run in worker threads and TTLCache is not thread-safe
+_cache_lock = threading.Lock()
 
 
 def get_document_by_hash(content_hash: str) -> Optional[str]:
-    """Check if document with given hash already exists."""
+    """Check if document with given hash already exists, caching found IDs."""
+    with _cache_lock:
+        cached = _document_ids_by_hash.get(content_hash)
+    if cached is not None:
+        return cached
+
     query = "SELECT id FROM documents WHERE content_hash = %s"
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (content_hash,))
+                cur.execute(query, (content_hash,), prepare=True)
                 row = cur.fetchone()
-        return str(row[0]) if row else None
     except Exception as e:
         logger.error(f"Database error in get_document_by_hash: {e}")
         raise DatabaseError(f"Failed to query document by hash: {e}")
 
+    if not row:
+        return None
+    document_id = str(row[0])
+    with _cache_lock:
+        _document_ids_by_hash[content_hash] = document_id
+    return document_id
+
 
 def document_exists(document_id: str) -> bool:
-    """Check if document with given ID exists."""
+    """Check if document with given ID exists, caching positive results."""
+    with _cache_lock:
+        if document_id in _existing_documents:
+            return True
+
     query = "SELECT EXISTS(SELECT 1 FROM documents WHERE id = %s)"
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (document_id,))
+                cur.execute(query, (document_id,), prepare=True)
                 row = cur.fetchone()
-        return bool(row[0]) if row else False
     except Exception as e:
         logger.error(f"Database error in document_exists: {e}")
         raise DatabaseError(f"Failed to check document existence: {e}")
 
+    exists = bool(row[0]) if row else False
+    if exists:
+        with _cache_lock:
+            _existing_documents[document_id] = True
+    return exists
 
-def insert_document(
+
+def _insert_document(
+    cur: Cursor,
     filename: str,
     file_type: str,
     file_size: int,
     content_hash: str,
 ) -> str:
-    """Create a new document record with processing status."""
+    """Insert a document record with processing status on the given cursor."""
     document_id = str(uuid.uuid4())
     query = """
         INSERT INTO documents (id, filename, file_type, file_size, content_hash, status)
         VALUES (%s, %s, %s, %s, %s, 'processing')
     """
+    cur.execute(query, (document_id, filename, file_type, file_size, content_hash))
+    return document_id
+
+
+def _insert_chunks(
+    cur: Cursor,
+    document_id: str,
+    chunks: Iterable[Document],
+    embeddings: np.ndarray,
+) -> int:
+    """
+    Stream chunk rows into a binary COPY on the given cursor.
+
+    Rows are written in a single COPY instead of one INSERT per chunk,
+    so ingest costs one round-trip regardless of chunk count.
+    """
+    query = """
+        COPY document_chunks (id, document_id, chunk_index, content, embedding, metadata)
+        FROM STDIN WITH (FORMAT BINARY)
+    """
+    doc_uuid = uuid.UUID(document_id)
+    # No copy for float32 input; rows are views dumped as packed float32
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    count = 0
+    with cur.copy(query) as cp:
+        cp.set_types(["uuid", "uuid", "int4", "text", "vector", "jsonb"])
+        for chunk_index, (document, vector) in enumerate(zip(chunks, vectors)):
+            metadata = document.metadata or {}
+            metadata["chunk_index"] = chunk_index
+            cp.write_row(
+                (
+                    uuid.uuid4(),
+                    doc_uuid,
+                    chunk_index,
+                    document.page_content or "",
+                    vector,
+                    Jsonb(metadata),
+                )
+            )
+            count += 1
+    return count
+
+
+def _mark_completed(cur: Cursor, document_id: str) -> None:
+    """Mark a document as processed on the given cursor."""
+    query = "UPDATE documents SET status = 'completed' WHERE id = %s"
+    cur.execute(query, (document_id,))
+
+
+def insert_document(
+    filename: str,
+    file_type: str,
+    file_size: int,
+    content_hash: str,
+) -> str:
+    """Create a new document record with processing status."""
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    query,
-                    (document_id, filename, file_type, file_size, content_hash),
+                document_id = _insert_document(
+                    cur, filename, file_type, file_size, content_hash
                 )
             conn.commit()
         return document_id
@@ -72,34 +166,15 @@ def insert_document(
 def insert_document_chunks(
     document_id: str,
     chunks: Iterable[Document],
-    embeddings: List[List[float]],
+    embeddings: np.ndarray,
 ) -> int:
     """Insert document chunks with their embeddings into the database."""
-    rows: List[Tuple] = []
-    for chunk_index, (document, embedding) in enumerate(zip(chunks, embeddings)):
-        id = str(uuid.uuid4())
-        metadata = document.metadata or {}
-        metadata["chunk_index"] = chunk_index
-        rows.append(
-            (
-                id,
-                document_id,
-                chunk_index,
-                document.page_content or "",
-                embedding,
-                json.dumps(metadata),
-            )
-        )
-    query = """
-        INSERT INTO document_chunks (id, document_id, chunk_index, content, embedding, metadata)
-        VALUES (%s, %s, %s, %s, %s, %s)
-    """
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.executemany(query, rows)
+                count = _insert_chunks(cur, document_id, chunks, embeddings)
             conn.commit()
-        return len(rows)
+        return count
     except Exception as e:
         logger.error(f"Database error in insert_document_chunks: {e}")
         raise DatabaseError(f"Failed to insert document chunks: {e}")
@@ -107,38 +182,75 @@ def insert_document_chunks(
 
 def mark_document_completed(document_id: str) -> None:
     """Mark document as successfully processed."""
-    query = "UPDATE documents SET status = 'completed' WHERE id = %s"
     try:
         with pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (document_id,))
+                _mark_completed(cur, document_id)
             conn.commit()
     except Exception as e:
         logger.error(f"Database error in mark_document_completed: {e}")
         raise DatabaseError(f"Failed to mark document as completed: {e}")
 
 
+def pack_batches(texts: List[str], tokens_per_batch: int) -> List[List[str]]:
+    """
+    Greedily pack texts into batches that fit the token budget.
+
+    Token counts are estimated at four characters per token, which is close
+    enough for sizing requests without loading the model's tokenizer.
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    tokens = 0
+    for text in texts:
+        count = len(text) // 4 + 1
+        if batch and tokens + count > tokens_per_batch:
+            batches.append(batch)
+            batch, tokens = [], 0
+        batch.append(text)
+        tokens += count
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _embed_with_retry(model, batch: List[str], max_retries: int) -> np.ndarray:
+    """Embed one batch as a float32 matrix, retrying with exponential backoff."""
+    for attempt in range(max_retries):
+        try:
+            return np.asarray(model.embed_documents(batch), dtype=np.float32)
+        except Exception:
+            if attempt == max_retries - 1:
+                raise
+            time.sleep(2**attempt)
+
+
 def batch_embed(
-    texts: List[str], model, batch_size: int = 32, max_retries: int = 3
-) -> List[List[float]]:
+    texts: List[str],
+    model,
+    tokens_per_batch: int | None = None,
+    max_retries: int = 3,
+) -> np.ndarray:
     """
-    Generate embeddings in batches with exponential backoff retry.
+    Generate embeddings in token-sized batches embedded concurrently.
 
-    Processes texts in smaller batches to avoid timeouts and retries
-    failed batches up to max_retries times with exponential backoff.
+    Texts are packed into batches up to tokens_per_batch and sent to the
+    provider in parallel threads. Each batch retries independently with
+    exponential backoff, and results keep the input order. Returns an
+    (n, dim) float32 matrix, a fraction of the size of nested float lists.
     """
-    embeddings = []
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        for attempt in range(max_retries):
-            try:
-                embeddings.extend(model.embed_documents(batch))
-                break
-            except Exception:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(2**attempt)
-    return embeddings
+    batches = pack_batches(texts, tokens_per_batch or settings.embed_tokens_per_batch)
+    if not batches:
+        return np.empty((0, 0), dtype=np.float32)
+    if len(batches) == 1:
+        return _embed_with_retry(model, batches[0], max_retries)
+
+    workers = min(EMBED_MAX_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda batch: _embed_with_retry(model, batch, max_retries), batches
+        )
+        return np.concatenate(list(results))
 
 
 def index_chunks(
@@ -154,21 +266,41 @@ def index_chunks(
     Returns (document_id, chunks_indexed). If document already exists
     based on content hash, returns existing ID with 0 chunks indexed.
     """
-    existing_id = get_document_by_hash(content_hash)
+    # Callers normally reject duplicates before indexing, so the lookup is
+    # overlapped with embedding instead of delaying it by a round-trip
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lookup = executor.submit(get_document_by_hash, content_hash)
+        try:
+            model = get_embedding_function()
+            texts = [c.page_content or "" for c in chunks]
+            embeddings = batch_embed(texts, model)
+        except Exception as e:
+            logger.error(f"Embedding error in index_chunks: {e}")
+            raise EmbeddingError(f"Failed to generate embeddings: {e}")
+        existing_id = lookup.result()
+
     if existing_id:
         return existing_id, 0
 
-    document_id = insert_document(filename, file_type, file_size, content_hash)
+    # Embeddings are ready before a connection is taken, so the document,
+    # its chunks and the status update commit together on one connection
     try:
-        model = get_embedding_function()
-        texts = [c.page_content or "" for c in chunks]
-        embeddings = batch_embed(texts, model)
+        with pool.connection() as conn:
+            with conn.transaction():
+                with conn.cursor() as cur:
+                    document_id = _insert_document(
+                        cur, filename, file_type, file_size, content_hash
+                    )
+                    count = _insert_chunks(cur, document_id, chunks, embeddings)
+                    _mark_completed(cur, document_id)
     except Exception as e:
-        logger.error(f"Embedding error in index_chunks: {e}")
-        raise EmbeddingError(f"Failed to generate embeddings: {e}")
+        logger.error(f"Database error in index_chunks: {e}")
+        raise DatabaseError(f"Failed to index document chunks: {e}")
 
-    count = insert_document_chunks(document_id, chunks, embeddings)
-    mark_document_completed(document_id)
+    # Committed, so later lookups can skip the database entirely
+    with _cache_lock:
+        _document_ids_by_hash[content_hash] = document_id
+        _existing_documents[document_id] = True
     return document_id, count
 
 
@@ -211,6 +343,11 @@ def delete_document_by_id(document_id: str) -> bool:
                 cur.execute(query, (document_id,))
                 deleted = cur.rowcount > 0
             conn.commit()
+        with _cache_lock:
+            _existing_documents.pop(document_id, None)
+            # Hash entries are keyed by content, so the deleted ID is not
+            # directly addressable; deletions are rare enough to drop them all
+            _document_ids_by_hash.clear()
         return deleted
     except Exception as e:
         logger.error(f"Database error in delete_document_by_id: {e}")
@@ -0,0 +1,23 @@
+"""Shared async HTTP client for direct Ollama API calls."""
+
+import httpx
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+ollama = httpx.AsyncClient(
+    base_url=settings.ollama_base_url,
+    headers=(
+        {"Authorization": f"Bearer {settings.ollama_api_key}"}
+        if settings.ollama_api_key
+        else None
+    ),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(5.0),
+)
+
+
+async def close_ollama():
+    """Close the Ollama HTTP connection pool during shutdown."""
+    await ollama.aclose()
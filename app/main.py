@@ -1,62 +1,69 @@
 """FastAPI application entry point with middleware and error handlers."""
 
-import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes.chat import router as chat_router
 from app.api.routes.documents import router as documents_router
 from app.api.routes.health import router as health_router
 from app.api.routes.root import router as root_router
 from app.api.routes.upload import router as upload_router
-from app.api.schemas.response import APIError
+from app.api.schemas.response import APIError, APIValidationError
+from app.core.config import get_settings
 from app.core.cors import configure_cors
+from app.core.guard import GuardMiddleware
+from app.core.inflight import InflightTracker
 from app.core.logger import get_logger, setup_logger
-from app.core.ratelimit import rate_limit
+from app.core.ratelimit import load_rate_limit_script
+from app.domain.documents.loader import close_pdf_executor
+from app.infra.cache.connection import close_redis
 from app.infra.database.connection import close_pool
+from app.infra.ollama.connection import close_ollama
 
-setup_logger()
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Upper bound on how long shutdown waits for in-flight requests
+SHUTDOWN_DRAIN_TIMEOUT = 2.0
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and graceful shutdown."""
+    setup_logger()
     logger.info("Application startup")
+    await load_rate_limit_script()
     yield
     logger.info("Application shutdown - waiting for requests...")
-    await asyncio.sleep(2)
+    if not await app.state.inflight.drain(SHUTDOWN_DRAIN_TIMEOUT):
+        logger.warning(
+            f"Shutting down with {app.state.inflight.count} requests still in flight"
+        )
+    close_pdf_executor()
     close_pool()
+    await close_redis()
+    await close_ollama()
+
 
+# Production builds skip the documentation routes and the OpenAPI schema
+docs_disabled = settings.env == "prod"
 
 app = FastAPI(
     title="RAG API",
     version="1.0.0",
     lifespan=lifespan,
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+    docs_url=None if docs_disabled else "/api/docs",
+    redoc_url=None if docs_disabled else "/api/redoc",
+    openapi_url=None if docs_disabled else "/api/openapi.json",
     swagger_ui_parameters={"useCdn": False},
 )
 
-
-@app.middleware("http")
-async def limit_upload_size(request: Request, call_next):
-    """Enforce global request size limit (210MB)."""
-    if request.method in ["POST", "PUT", "PATCH"]:
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > 210 * 1024 * 1024:
-            return JSONResponse(
-                status_code=413,
-                content={"code": "PAYLOAD_TOO_LARGE", "message": "Request too large"},
-            )
-    return await call_next(request)
-
-
-app.middleware("http")(rate_limit)
+app.state.inflight = InflightTracker()
+app.add_middleware(GuardMiddleware, inflight=app.state.inflight)
 
 configure_cors(app)
 
@@ -69,14 +76,18 @@ app.include_router(documents_router)
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    """Convert HTTPException to consistent APIError format."""
+    """
+    Convert HTTPException to consistent APIError format.
+
+    The fields are built server-side, so the error skips model validation.
+    """
     detail = exc.detail
     if isinstance(detail, dict) and "code" in detail and "message" in detail:
-        error = APIError(code=detail["code"], message=detail["message"])
+        error = APIError.model_construct(code=detail["code"], message=detail["message"])
     else:
-        error = APIError(code="HTTP_ERROR", message=str(detail))
+        error = APIError.model_construct(code="HTTP_ERROR", message=str(detail))
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error.model_dump(),
     )
@@ -87,9 +98,23 @@ async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
 ):
-    """Convert validation errors to consistent APIError format."""
-    error = APIError(code="VALIDATION_ERROR", message=str(exc))
-    return JSONResponse(
+    """
+    Convert validation errors to consistent APIError format.
+
+    Only location, message and type are kept per error. Formatting the
+    exception as a string walks every error, and raw inputs may not be
+    JSON serializable (e.g. uploaded files).
+    """
+    errors = [
+        {"loc": err["loc"], "msg": err["msg"], "type": err["type"]}
+        for err in exc.errors()
+    ]
+    error = APIValidationError.model_construct(
+        code="VALIDATION_ERROR",
+        message="Invalid request",
+        errors=errors,
+    )
+    return ORJSONResponse(
         status_code=422,
         content=error.model_dump(),
     )
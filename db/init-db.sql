@@ -26,7 +26,8 @@ CREATE TABLE IF NOT EXISTS document_chunks (
     chunk_index int NOT NULL,
     content text NOT NULL,
     embedding vector(1024) NOT NULL,
-    metadata jsonb NOT NULL DEFAULT '{}'::jsonb
+    metadata jsonb NOT NULL DEFAULT '{}'::jsonb,
+    content_tsv tsvector GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED
 );
 
 -- =====================================================================
@@ -42,4 +43,6 @@ CREATE INDEX IF NOT EXISTS idx_chunks_document ON document_chunks (document_id);
 
 CREATE INDEX IF NOT EXISTS idx_chunks_chunk_index ON document_chunks (chunk_index);
 
-CREATE INDEX IF NOT EXISTS idx_chunks_metadata_jsonb ON document_chunks USING gin (metadata);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_chunks_metadata_jsonb ON document_chunks USING gin (metadata);
+
+CREATE INDEX IF NOT EXISTS idx_chunks_content_tsv ON document_chunks USING gin (content_tsv);
\ No newline at end of file
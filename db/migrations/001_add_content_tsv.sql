@@ -0,0 +1,8 @@
+-- =====================================================================
+-- Full-text search column for hybrid retrieval
+-- =====================================================================
+
+ALTER TABLE document_chunks
+ADD COLUMN IF NOT EXISTS content_tsv tsvector GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_chunks_content_tsv ON document_chunks USING gin (content_tsv);
@@ -4,6 +4,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi.testclient import TestClient
 
 # Set test environment variables at module import time
 _test_env = {
@@ -36,6 +37,20 @@ for _key, _value in _test_env.items():
     os.environ[_key] = _value
 
 
+# Chunks yielded by every mocked chat stream
+_MOCK_CHUNKS = ("Mocked ", "streaming ", "response")
+
+# Mock model instances are built once and shared by every test
+_mock_embed_instance = MagicMock()
+_mock_embed_instance.embed_documents.return_value = [[0.1] * 768]
+_mock_embed_instance.embed_query.return_value = [0.1] * 768
+
+_mock_chat_instance = MagicMock()
+_mock_chat_instance.invoke.return_value = MagicMock(content="Mocked response")
+# A fresh iterator per call, so later tests do not get an exhausted stream
+_mock_chat_instance.stream.side_effect = lambda *args, **kwargs: iter(_MOCK_CHUNKS)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def mock_ollama_for_all_tests():
     """
@@ -45,23 +60,28 @@ def mock_ollama_for_all_tests():
     - OllamaEmbeddings for embedding generation
     - ChatOllama for chat completions
     """
-    with patch("app.domain.embeddings.provider.OllamaEmbeddings") as mock_embeddings:
-        mock_embed_instance = MagicMock()
-        mock_embed_instance.embed_documents.return_value = [[0.1] * 768]
-        mock_embed_instance.embed_query.return_value = [0.1] * 768
-        mock_embeddings.return_value = mock_embed_instance
-
-        with patch("app.domain.rag.model.ChatOllama") as mock_chat:
-            mock_chat_instance = MagicMock()
-            mock_chat_instance.invoke.return_value = MagicMock(
-                content="Mocked response"
-            )
-            mock_chat_instance.stream.return_value = iter(
-                ["Mocked ", "streaming ", "response"]
-            )
-            mock_chat.return_value = mock_chat_instance
-
-            yield
+    with (
+        patch(
+            "app.domain.embeddings.provider.OllamaEmbeddings",
+            return_value=_mock_embed_instance,
+        ),
+        patch("app.domain.rag.model.ChatOllama", return_value=_mock_chat_instance),
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Provide one TestClient shared by all integration tests.
+
+    The app is imported here, after the test environment is set, and
+    its lifespan runs once for the whole session.
+    """
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
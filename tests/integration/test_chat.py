@@ -2,12 +2,6 @@
 
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
 
 def fake_stream_rag(query, document_id=None):
     """
@@ -29,7 +23,7 @@ def fake_stream_rag(query, document_id=None):
     yield " world"
 
 
-def test_chat_endpoint():
+def test_chat_endpoint(client):
     """
     Test chat endpoint returns streaming response across all documents.
 
@@ -48,7 +42,7 @@ def test_chat_endpoint():
         assert "world" in text
 
 
-def test_chat_with_document_endpoint(test_document_id):
+def test_chat_with_document_endpoint(test_document_id, client):
     """
     Test chat endpoint with specific document ID returns filtered response.
 
@@ -72,7 +66,7 @@ def test_chat_with_document_endpoint(test_document_id):
         assert "world" in text
 
 
-def test_chat_with_nonexistent_document(nonexistent_document_id):
+def test_chat_with_nonexistent_document(nonexistent_document_id, client):
     """
     Test chat endpoint returns 404 for nonexistent document.
 
@@ -89,3 +83,36 @@ def test_chat_with_nonexistent_document(nonexistent_document_id):
         assert response.status_code == 404
         data = response.json()
         assert data["code"] == "DOCUMENT_NOT_FOUND"
+
+
+def test_chat_rejects_dangerous_input(client):
+    """
+    Test chat endpoint rejects messages containing dangerous patterns.
+
+    Verifies:
+    - Pattern matching is case-insensitive
+    - Returns 400 status code
+    - Error response includes correct error code
+    """
+    response = client.post("/api/chat", json={"message": "Hi <SCRIPT>alert(1)"})
+
+    assert response.status_code == 400
+    data = response.json()
+    assert data["code"] == "CHAT_INVALID_INPUT"
+
+
+def test_chat_rejects_empty_message(client):
+    """
+    Test chat endpoint returns structured validation errors.
+
+    Verifies:
+    - Returns 422 status code
+    - Error response includes the validation error code
+    - Each error lists the offending field location
+    """
+    response = client.post("/api/chat", json={"message": ""})
+
+    assert response.status_code == 422
+    data = response.json()
+    assert data["code"] == "VALIDATION_ERROR"
+    assert data["errors"][0]["loc"] == ["body", "message"]
@@ -0,0 +1,58 @@
+"""Integration tests for document management endpoints."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+
+def test_list_documents_endpoint(test_document_id, client):
+    """
+    Test document list endpoint returns all indexed documents.
+
+    Verifies:
+    - Endpoint returns 200 status code
+    - Response success flag is True
+    - Response includes correct status code
+    - Response data contains document items and total count
+    """
+    docs = [
+        {
+            "id": test_document_id,
+            "filename": "test.pdf",
+            "file_type": "pdf",
+            "file_size": 1024,
+            "status": "completed",
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        }
+    ]
+
+    with patch("app.api.routes.documents.list_all_documents", return_value=docs):
+        response = client.get("/api/documents")
+
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["success"] is True
+    assert body["code"] == "DOCUMENTS_LIST_SUCCESS"
+
+    data = body["data"]
+    assert data["total"] == 1
+    assert data["documents"][0]["id"] == test_document_id
+    assert data["documents"][0]["filename"] == "test.pdf"
+    # Timestamps keep Pydantic's UTC "Z" suffix on the wire
+    assert data["documents"][0]["created_at"] == "2025-01-01T00:00:00Z"
+
+
+def test_delete_nonexistent_document(nonexistent_document_id, client):
+    """
+    Test delete endpoint returns 404 for nonexistent document.
+
+    Verifies:
+    - Returns 404 status code
+    - Error response includes correct error code
+    """
+    with patch("app.api.routes.documents.delete_document_by_id", return_value=False):
+        response = client.delete(f"/api/documents/{nonexistent_document_id}")
+
+    assert response.status_code == 404
+    data = response.json()
+    assert data["code"] == "DOCUMENT_NOT_FOUND"
@@ -1,16 +1,23 @@
 """Integration tests for health check endpoint."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from fastapi.testclient import TestClient
+import pytest
 
-from app.main import app
+from app.api.routes.health import _last_probe, health
 
-client = TestClient(app)
 
+@pytest.fixture(autouse=True)
+def fresh_probe():
+    """Expire cached probe results so each test runs its own probe."""
+    _last_probe.update(ts=0.0, ollama="unknown", db="unknown")
+    yield
+    _last_probe.update(ts=0.0, ollama="unknown", db="unknown")
 
-@patch("app.api.routes.health.get_chat_model")
-def test_health_endpoint(mock_get_chat_model):
+
+@patch("app.api.routes.health.ollama")
+def test_health_endpoint(mock_ollama, client):
     """
     Test health endpoint returns correct status information.
 
@@ -26,10 +33,8 @@ def test_health_endpoint(mock_get_chat_model):
     - Database connectivity
     - Connection pool statistics
     """
-    # Mock Ollama model to simulate healthy service
-    mock_model = MagicMock()
-    mock_model.invoke.return_value = "pong"
-    mock_get_chat_model.return_value = mock_model
+    # Mock Ollama client to simulate healthy service
+    mock_ollama.get = AsyncMock(return_value=MagicMock())
 
     # Send health check request
     response = client.get("/api/health")
@@ -45,3 +50,88 @@ def test_health_endpoint(mock_get_chat_model):
     assert data["code"] == "HEALTH_OK"
     assert data["message"] == "Service is healthy"
     assert data["data"]["status"] == "healthy"
+
+
+@patch("app.api.routes.health.pool")
+@patch("app.api.routes.health.ollama")
+def test_health_endpoint_reuses_cached_probe(mock_ollama, mock_pool, client):
+    """
+    Test health endpoint reuses probe results within the TTL.
+
+    Verifies:
+    - Consecutive health checks only probe Ollama once
+    - Cached statuses are still reported in the response
+
+    Probing Ollama on every liveness check would compete with real
+    chat traffic, so results are cached for a short period.
+    """
+    # Mock Ollama client and connection pool
+    mock_ollama.get = AsyncMock(return_value=MagicMock())
+    mock_pool.get_stats.return_value = {"pool_size": 1, "pool_available": 1}
+
+    first = client.get("/api/health")
+    second = client.get("/api/health")
+
+    # Verify Ollama was only probed once
+    mock_ollama.get.assert_awaited_once_with("/api/version")
+
+    # Verify both responses report the same status
+    assert first.json()["data"] == second.json()["data"]
+    assert second.json()["data"]["ollama"] == "healthy"
+
+
+@patch("app.api.routes.health.pool")
+@patch("app.api.routes.health.ollama")
+def test_health_endpoint_shares_concurrent_probe(mock_ollama, mock_pool):
+    """
+    Test concurrent health checks after the TTL share a single probe.
+
+    Verifies:
+    - Requests arriving together with a stale cache probe Ollama once
+    - Every request reports the shared probe result
+
+    Without a shared probe, each request that finds the cache expired
+    would start its own Ollama and database round-trip.
+    """
+
+    async def slow_version(path):
+        # Keep the probe in flight while the other requests arrive
+        await asyncio.sleep(0.05)
+        return MagicMock()
+
+    mock_ollama.get = AsyncMock(side_effect=slow_version)
+    mock_pool.get_stats.return_value = {"pool_size": 1, "pool_available": 1}
+
+    async def burst():
+        return await asyncio.gather(*(health() for _ in range(5)))
+
+    responses = asyncio.run(burst())
+
+    mock_ollama.get.assert_awaited_once_with("/api/version")
+    assert all(b'"ollama":"healthy"' in response.body for response in responses)
+
+
+@patch("app.api.routes.health.pool")
+@patch("app.api.routes.health.ollama")
+def test_health_endpoint_reports_unexpected_ollama_error(
+    mock_ollama, mock_pool, client
+):
+    """
+    Test an unexpected Ollama client error degrades health instead of failing.
+
+    Verifies:
+    - Non-HTTP errors from the client still return a health payload
+    - Ollama is reported as unhealthy with a degraded code
+
+    A closed client during shutdown raises RuntimeError rather than an
+    httpx error, and the health endpoint must still answer.
+    """
+    mock_ollama.get = AsyncMock(side_effect=RuntimeError("client has been closed"))
+    mock_pool.get_stats.return_value = {"pool_size": 1, "pool_available": 1}
+
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["code"] == "HEALTH_DEGRADED"
+    assert data["data"]["ollama"] == "unhealthy"
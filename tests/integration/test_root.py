@@ -1,13 +1,7 @@
 """Integration tests for API root endpoint."""
 
-from fastapi.testclient import TestClient
 
-from app.main import app
-
-client = TestClient(app)
-
-
-def test_root_endpoint():
+def test_root_endpoint(client):
     """
     Test API root endpoint returns version and status information.
 
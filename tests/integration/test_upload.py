@@ -1,18 +1,14 @@
 """Integration tests for document upload endpoint."""
 
+import hashlib
 import io
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
 
+@patch("app.domain.uploads.processor.get_document_by_hash", return_value=None)
 @patch("app.domain.uploads.processor.index_chunks", return_value=("docid", 5))
 @patch("app.domain.uploads.processor.load_document", return_value=[])
-def test_upload_endpoint(mock_load, mock_index, tmp_path):
+def test_upload_endpoint(mock_load, mock_index, mock_lookup, tmp_path, client):
     """
     Test document upload endpoint processes file successfully.
 
@@ -30,10 +26,12 @@ def test_upload_endpoint(mock_load, mock_index, tmp_path):
     Mocks:
     - load_document: Returns empty list to skip actual document loading
     - index_chunks: Returns mock document_id and chunk count
+    - get_document_by_hash: Reports no existing duplicate
 
     Args:
         mock_load: Mock for document loading
         mock_index: Mock for chunk indexing
+        mock_lookup: Mock for duplicate lookup
         tmp_path: Pytest fixture for temporary directory
     """
     # Create temporary upload directory
@@ -67,3 +65,114 @@ def test_upload_endpoint(mock_load, mock_index, tmp_path):
         assert data["filename"] == "test.pdf"
         assert data["document_id"] == "docid"
         assert data["chunks_indexed"] == 5
+
+
+@patch("app.domain.uploads.processor.get_document_by_hash", return_value=None)
+@patch("app.domain.uploads.processor.index_chunks", return_value=("docid", 5))
+@patch("app.domain.uploads.processor.load_document", return_value=[])
+def test_upload_hashes_content_before_saving(
+    mock_load, mock_index, mock_lookup, tmp_path, client
+):
+    """
+    Test the content hash is computed from the upload stream.
+
+    Verifies:
+    - Duplicate lookup receives the SHA-256 of the uploaded bytes
+    - Saved file contents still match the uploaded bytes after hashing
+
+    Args:
+        mock_load: Mock for document loading
+        mock_index: Mock for chunk indexing
+        mock_lookup: Mock for duplicate lookup
+        tmp_path: Pytest fixture for temporary directory
+    """
+    fake_dir = tmp_path / "uploads"
+    fake_dir.mkdir()
+    payload = b"x" * (3 * 1024 * 1024 + 17)
+
+    with patch("app.domain.uploads.processor.BASE_UPLOAD_DIR", fake_dir):
+        response = client.post(
+            "/api/upload",
+            files={"file": ("large.pdf", io.BytesIO(payload), "application/pdf")},
+        )
+
+    assert response.status_code == 200
+
+    # Hash matches a direct digest of the same bytes
+    expected = hashlib.sha256(payload).hexdigest()
+    mock_lookup.assert_called_once_with(expected)
+    assert mock_index.call_args.kwargs["content_hash"] == expected
+
+    # Upload is rewound after hashing, so the full file is saved
+    assert (fake_dir / "large.pdf").read_bytes() == payload
+
+
+@patch("app.domain.uploads.processor.get_document_by_hash", return_value="existing")
+@patch("app.domain.uploads.processor.index_chunks")
+@patch("app.domain.uploads.processor.load_document")
+def test_upload_duplicate_skips_disk(
+    mock_load, mock_index, mock_lookup, tmp_path, client
+):
+    """
+    Test duplicate uploads return early without being saved.
+
+    Verifies:
+    - Response reports the existing document with 0 chunks indexed
+    - Nothing is written to the upload directory
+    - Loading and indexing are skipped entirely
+
+    Args:
+        mock_load: Mock for document loading
+        mock_index: Mock for chunk indexing
+        mock_lookup: Mock for duplicate lookup
+        tmp_path: Pytest fixture for temporary directory
+    """
+    fake_dir = tmp_path / "uploads"
+    fake_dir.mkdir()
+
+    with patch("app.domain.uploads.processor.BASE_UPLOAD_DIR", fake_dir):
+        response = client.post(
+            "/api/upload",
+            files={"file": ("test.pdf", io.BytesIO(b"dup"), "application/pdf")},
+        )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["document_id"] == "existing"
+    assert data["chunks_indexed"] == 0
+
+    assert list(fake_dir.iterdir()) == []
+    mock_load.assert_not_called()
+    mock_index.assert_not_called()
+
+
+@patch("app.domain.uploads.processor.get_document_by_hash")
+def test_upload_rejects_oversized_file_mid_stream(mock_lookup, tmp_path, client):
+    """
+    Test uploads over the size limit are rejected while reading.
+
+    Verifies:
+    - Returns 413 with UPLOAD_FILE_TOO_LARGE code
+    - No duplicate lookup or disk write happens
+
+    Args:
+        mock_lookup: Mock for duplicate lookup
+        tmp_path: Pytest fixture for temporary directory
+    """
+    fake_dir = tmp_path / "uploads"
+    fake_dir.mkdir()
+    payload = b"x" * (2 * 1024 * 1024)
+
+    with (
+        patch("app.domain.uploads.processor.BASE_UPLOAD_DIR", fake_dir),
+        patch("app.domain.uploads.processor.MAX_FILE_SIZE", 1024 * 1024),
+    ):
+        response = client.post(
+            "/api/upload",
+            files={"file": ("big.pdf", io.BytesIO(payload), "application/pdf")},
+        )
+
+    assert response.status_code == 413
+    assert response.json()["code"] == "UPLOAD_FILE_TOO_LARGE"
+    mock_lookup.assert_not_called()
+    assert list(fake_dir.iterdir()) == []
@@ -1,59 +1,32 @@
 """Unit tests for adaptive chunk size selection."""
 
-from app.domain.documents.splitter import choose_chunk_size
-
-
-def test_choose_chunk_size_small():
-    """
-    Test chunk size selection for small documents.
-
-    Verifies:
-    - Small documents (< 2000 chars) get reduced chunk size
-    - Chunk size is at least 300 characters
-    - Size is calculated as 80% of base size
-
-    This prevents over-chunking of short documents which could
-    lead to fragmented context and poor retrieval quality.
-    """
-    # Test with 500 character document
-    result = choose_chunk_size(500)
-
-    # Verify minimum chunk size threshold
-    assert result >= 300
+import pytest
 
-
-def test_choose_chunk_size_medium():
-    """
-    Test chunk size selection for medium documents.
-
-    Verifies:
-    - Medium documents (2000-10000 chars) use base chunk size
-    - Returns exactly the configured base size (800)
-
-    This provides optimal chunking for typical document sizes
-    without requiring adjustment.
-    """
-    # Test with 3000 character document
-    result = choose_chunk_size(3000)
-
-    # Verify returns base chunk size
-    assert result == 800
+from app.domain.documents.splitter import choose_chunk_size
 
 
-def test_choose_chunk_size_large():
+@pytest.mark.parametrize(
+    ("length", "expected"),
+    [
+        # Small documents (< 2000 chars) get 80% of base, at least 300
+        (500, 640),
+        # Medium documents (2000-10000 chars) use the base size (800)
+        (3000, 800),
+        # Large documents (> 10000 chars) get 60% of base, at least 400
+        (20000, 480),
+    ],
+)
+def test_choose_chunk_size(length, expected):
     """
-    Test chunk size selection for large documents.
+    Test chunk size selection across document sizes.
 
     Verifies:
-    - Large documents (> 10000 chars) get reduced chunk size
-    - Chunk size is at least 400 characters
-    - Size is calculated as 60% of base size
+    - Small documents get a reduced chunk size
+    - Medium documents return exactly the configured base size
+    - Large documents get a reduced chunk size
+    - Reduced sizes never drop below their minimum thresholds
 
-    This improves retrieval granularity for large documents
-    by creating more, smaller chunks for better matching.
+    Smaller chunks avoid over-chunking short documents, and more,
+    smaller chunks improve retrieval granularity for large ones.
     """
-    # Test with 20000 character document
-    result = choose_chunk_size(20000)
-
-    # Verify minimum chunk size threshold
-    assert result >= 400
+    assert choose_chunk_size(length) == expected
@@ -0,0 +1,86 @@
+"""Unit tests for the request guard middleware."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.core.guard import SIZE_LIMIT, GuardMiddleware
+from app.core.inflight import InflightTracker
+
+
+def _scope(method: str = "GET", headers: list | None = None) -> dict:
+    """Build a minimal HTTP scope for the guard."""
+    return {
+        "type": "http",
+        "method": method,
+        "path": "/test",
+        "client": ("10.0.1.1", 123),
+        "headers": headers or [],
+    }
+
+
+def _run(scope: dict, allowed: bool = True) -> tuple[list, AsyncMock]:
+    """Run the guard around a dummy app and collect sent messages."""
+    inner = AsyncMock()
+    guard = GuardMiddleware(inner, inflight=InflightTracker())
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    with patch("app.core.guard.take_token", AsyncMock(return_value=allowed)):
+        asyncio.run(guard(scope, AsyncMock(), send))
+
+    return sent, inner
+
+
+def test_guard_passes_allowed_requests_through():
+    """
+    Test allowed requests reach the wrapped application.
+
+    Verifies:
+    - The inner app is called with the original scope
+    - The guard sends nothing itself
+    """
+    scope = _scope()
+    sent, inner = _run(scope)
+
+    inner.assert_awaited_once()
+    assert inner.await_args.args[0] is scope
+    assert sent == []
+
+
+def test_guard_rejects_oversized_bodies():
+    """
+    Test bodies over the size limit are rejected before the app runs.
+
+    Verifies:
+    - A content-length above the limit returns 413
+    - The connection is closed instead of reading the body
+    - The inner app is never called
+    """
+    headers = [(b"content-length", str(SIZE_LIMIT + 1).encode())]
+    sent, inner = _run(_scope("POST", headers))
+
+    inner.assert_not_awaited()
+    assert sent[0]["status"] == 413
+    assert (b"connection", b"close") in sent[0]["headers"]
+    assert b"PAYLOAD_TOO_LARGE" in sent[1]["body"]
+
+    # Each rejection gets its own header list for outer middleware to extend
+    second, _ = _run(_scope("POST", headers))
+    assert second[0]["headers"] is not sent[0]["headers"]
+
+
+def test_guard_rejects_rate_limited_requests():
+    """
+    Test requests without a token get a 429 JSON error.
+
+    Verifies:
+    - The response carries the rate limit error code
+    - The inner app is never called
+    """
+    sent, inner = _run(_scope(), allowed=False)
+
+    inner.assert_not_awaited()
+    assert sent[0]["status"] == 429
+    assert b"RATE_LIMIT_EXCEEDED" in sent[1]["body"]
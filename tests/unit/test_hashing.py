@@ -1,31 +1,47 @@
-"""Unit tests for content-based file hashing."""
+"""Unit tests for content-based upload hashing."""
 
-from app.domain.documents.hashing import compute_file_hash
+import asyncio
+import hashlib
+import io
 
+from fastapi import UploadFile
 
-def test_compute_file_hash(tmp_path):
+from app.domain.uploads.processor import UPLOAD_CHUNK_SIZE, hash_upload
+
+
+def test_hash_upload_matches_sha256():
     """
-    Test SHA-256 hash generation for file contents.
+    Test upload hash matches a SHA-256 digest of the same bytes.
 
     Verifies:
-    - Hash is generated successfully
-    - Hash is returned as string
-    - Hash length is 64 characters (SHA-256 hex format)
+    - Hash is identical to hashlib.sha256 over the upload contents
+    - Hash is returned as a 64 character hex string
+    - The returned size counts every byte across read chunks
+
+    Stored content hashes must stay stable so files indexed earlier
+    are still detected as duplicates.
+    """
+    # Create upload larger than a single read chunk
+    content = b"hello test" * (UPLOAD_CHUNK_SIZE // 5)
+    upload = UploadFile(file=io.BytesIO(content), filename="test.pdf")
+
+    content_hash, file_size = asyncio.run(hash_upload(upload))
 
-    The hash is used for duplicate detection during file upload.
-    Files with identical content will produce the same hash,
-    allowing the system to skip redundant indexing.
+    # Verify digest matches the reference implementation
+    assert content_hash == hashlib.sha256(content).hexdigest()
+    assert len(content_hash) == 64
+    assert file_size == len(content)
 
-    Args:
-        tmp_path: Pytest fixture providing temporary directory
+
+def test_hash_upload_rewinds_file():
+    """
+    Test the upload is rewound after hashing.
+
+    Verifies:
+    - The full file can be read again for saving after hashing
     """
-    # Create test file with known content
-    file = tmp_path / "test.txt"
-    file.write_text("hello test")
+    upload = UploadFile(file=io.BytesIO(b"hello test"), filename="test.pdf")
 
-    # Compute SHA-256 hash of file contents
-    result = compute_file_hash(str(file))
+    asyncio.run(hash_upload(upload))
 
-    # Verify hash format
-    assert isinstance(result, str)
-    assert len(result) == 64  # SHA-256 produces 64 hex characters
+    assert upload.file.read() == b"hello test"
@@ -0,0 +1,47 @@
+"""Unit tests for in-flight request tracking."""
+
+import asyncio
+
+from app.core.inflight import InflightTracker
+
+
+def test_drain_returns_once_requests_finish():
+    """
+    Test draining completes as soon as the last request finishes.
+
+    Verifies:
+    - An idle tracker drains immediately
+    - Draining waits for in-flight requests instead of a fixed delay
+    - The count returns to zero after all requests finish
+    """
+    tracker = InflightTracker()
+
+    async def scenario() -> tuple[bool, bool]:
+        idle = await tracker.drain(timeout=0.1)
+        tracker.start()
+        tracker.start()
+        asyncio.get_running_loop().call_later(0.01, tracker.finish)
+        asyncio.get_running_loop().call_later(0.02, tracker.finish)
+        drained = await tracker.drain(timeout=1.0)
+        return idle, drained
+
+    idle, drained = asyncio.run(scenario())
+
+    assert idle is True
+    assert drained is True
+    assert tracker.count == 0
+
+
+def test_drain_times_out_with_stuck_request():
+    """
+    Test draining gives up after the timeout.
+
+    Verifies:
+    - drain returns False while a request is still in flight
+    - The in-flight count is left untouched
+    """
+    tracker = InflightTracker()
+    tracker.start()
+
+    assert asyncio.run(tracker.drain(timeout=0.01)) is False
+    assert tracker.count == 1
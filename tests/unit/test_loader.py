@@ -1,8 +1,16 @@
 """Unit tests for PDF document loading."""
 
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 from pypdf import PdfWriter
 
-from app.domain.documents.loader import load_pdf
+from app.domain.documents.loader import (
+    PARALLEL_PAGE_THRESHOLD,
+    close_pdf_executor,
+    get_pdf_executor,
+    load_pdf,
+)
 
 
 def test_load_pdf(tmp_path):
@@ -35,3 +43,51 @@ def test_load_pdf(tmp_path):
     # Verify blank PDF returns no documents
     # (blank pages have no extractable text > 10 chars)
     assert load_pdf(str(path)) == []
+
+
+def test_load_pdf_parallel(tmp_path):
+    """
+    Test PDF loading above the parallel threshold uses worker processes.
+
+    Verifies:
+    - Large PDFs are extracted through the process pool path
+    - Blank pages are still filtered out
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    path = tmp_path / "large.pdf"
+
+    # Create blank PDF with more pages than the in-process threshold
+    writer = PdfWriter()
+    for _ in range(PARALLEL_PAGE_THRESHOLD + 1):
+        writer.add_blank_page(width=72, height=72)
+
+    with open(path, "wb") as f:
+        writer.write(f)
+
+    assert load_pdf(str(path)) == []
+
+
+def test_pdf_executor_is_created_once_and_closed():
+    """
+    Test the PDF process pool is shared across threads and shut down.
+
+    Verifies:
+    - Concurrent first calls from worker threads create a single pool
+    - Closing shuts the pool down and cancels pending work
+    - Closing an unstarted pool does nothing
+    """
+    # Drop any pool started by earlier tests
+    close_pdf_executor()
+
+    with patch("app.domain.documents.loader.ProcessPoolExecutor") as mock_pool:
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            pools = list(threads.map(lambda _: get_pdf_executor(), range(8)))
+
+        close_pdf_executor()
+        close_pdf_executor()
+
+    assert mock_pool.call_count == 1
+    assert all(pool is pools[0] for pool in pools)
+    pools[0].shutdown.assert_called_once_with(cancel_futures=True)
@@ -0,0 +1,222 @@
+"""Unit tests for database query helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+
+from app.infra.database import queries
+from app.infra.database.queries import (
+    batch_embed,
+    delete_document_by_id,
+    document_exists,
+    get_document_by_hash,
+    index_chunks,
+    insert_document_chunks,
+    pack_batches,
+)
+
+
+@pytest.fixture
+def mock_cursor():
+    """
+    Provide a mocked cursor behind the connection pool.
+
+    Patches the module-level pool so query helpers run against a
+    MagicMock cursor instead of a live PostgreSQL connection.
+    """
+    cursor = MagicMock()
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    with patch("app.infra.database.queries.pool", pool):
+        queries._existing_documents.clear()
+        queries._document_ids_by_hash.clear()
+        yield cursor
+        queries._existing_documents.clear()
+        queries._document_ids_by_hash.clear()
+
+
+def test_document_exists_caches_positive_result(mock_cursor, test_document_id):
+    """
+    Test existing documents are cached after the first lookup.
+
+    Verifies:
+    - First lookup queries the database
+    - Repeated lookups are served from cache
+    - Deleting the document evicts the cached entry
+    """
+    mock_cursor.fetchone.return_value = (True,)
+    mock_cursor.rowcount = 1
+
+    assert document_exists(test_document_id) is True
+    assert document_exists(test_document_id) is True
+    assert mock_cursor.execute.call_count == 1
+
+    # Deleting evicts the entry so the next lookup hits the database
+    assert delete_document_by_id(test_document_id) is True
+    mock_cursor.fetchone.return_value = (False,)
+    assert document_exists(test_document_id) is False
+
+
+def test_document_exists_does_not_cache_missing(mock_cursor, nonexistent_document_id):
+    """
+    Test missing documents are not cached.
+
+    Verifies:
+    - A missing document is looked up again on the next call
+
+    A document uploaded right after a failed lookup must be
+    found immediately rather than after the cache expires.
+    """
+    mock_cursor.fetchone.return_value = (False,)
+
+    assert document_exists(nonexistent_document_id) is False
+    assert document_exists(nonexistent_document_id) is False
+    assert mock_cursor.execute.call_count == 2
+
+
+def test_insert_document_chunks_uses_single_copy(mock_cursor, test_document_id):
+    """
+    Test chunks are written through one binary COPY.
+
+    Verifies:
+    - A single COPY statement is issued instead of per-row INSERTs
+    - Every chunk is written as one row with a float32 embedding
+    - Chunk index is recorded in the stored metadata
+    """
+    chunks = [Document(page_content=f"chunk {i}", metadata={}) for i in range(3)]
+    embeddings = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+    copy = mock_cursor.copy.return_value.__enter__.return_value
+
+    count = insert_document_chunks(test_document_id, chunks, embeddings)
+
+    assert count == 3
+    mock_cursor.copy.assert_called_once()
+    mock_cursor.executemany.assert_not_called()
+    assert copy.write_row.call_count == 3
+
+    # Row layout matches the COPY column list
+    row = copy.write_row.call_args_list[1].args[0]
+    assert str(row[1]) == test_document_id
+    assert row[2] == 1
+    assert row[3] == "chunk 1"
+    assert row[4].dtype == "float32"
+    assert row[5].obj["chunk_index"] == 1
+
+
+def test_pack_batches_respects_token_budget():
+    """
+    Test texts are packed greedily up to the token budget.
+
+    Verifies:
+    - Batches never exceed the budget when texts fit
+    - An oversized text still gets a batch of its own
+    - Input order is preserved across batches
+    """
+    texts = ["a" * 40, "b" * 40, "c" * 40, "d" * 400]
+
+    batches = pack_batches(texts, tokens_per_batch=25)
+
+    assert batches == [["a" * 40, "b" * 40], ["c" * 40], ["d" * 400]]
+
+
+def test_batch_embed_preserves_order_across_batches():
+    """
+    Test concurrent batches return embeddings in input order.
+
+    Verifies:
+    - Each text is embedded exactly once
+    - Results line up with the input texts
+    - Embeddings are returned as one float32 matrix
+    """
+    model = MagicMock()
+    model.embed_documents.side_effect = lambda batch: [[float(t)] for t in batch]
+    texts = [str(i) for i in range(20)]
+
+    embeddings = batch_embed(texts, model, tokens_per_batch=3)
+
+    assert embeddings.dtype == "float32"
+    assert embeddings.tolist() == [[float(i)] for i in range(20)]
+    assert model.embed_documents.call_count > 1
+
+
+def test_index_chunks_uses_one_transaction(mock_cursor):
+    """
+    Test indexing writes the document and chunks in one transaction.
+
+    Verifies:
+    - Embeddings are generated before a connection is taken
+    - Document insert, chunk COPY and status update share one connection
+    - The write happens inside a single transaction block
+    """
+    chunks = [Document(page_content="chunk", metadata={})]
+    mock_cursor.fetchone.return_value = None
+
+    with (
+        patch("app.infra.database.queries.get_embedding_function"),
+        patch("app.infra.database.queries.batch_embed", return_value=[[0.1, 0.2]]),
+    ):
+        document_id, count = index_chunks("a.pdf", "pdf", 10, "hash", chunks)
+
+    assert count == 1
+    assert document_id
+
+    # One connection for the duplicate lookup and one for the write
+    assert queries.pool.connection.call_count == 2
+    conn = queries.pool.connection.return_value.__enter__.return_value
+    conn.transaction.assert_called_once()
+
+    # Insert and status update run on the same cursor as the COPY
+    statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+    assert "INSERT INTO documents" in statements[1]
+    assert "UPDATE documents" in statements[2]
+    mock_cursor.copy.assert_called_once()
+
+
+def test_get_document_by_hash_caches_found_ids(mock_cursor, test_document_id):
+    """
+    Test found hashes are cached and dropped again on delete.
+
+    Verifies:
+    - Repeated lookups of a known hash skip the database
+    - Unknown hashes are always looked up again
+    - Deleting a document clears cached hash lookups
+    """
+    mock_cursor.fetchone.return_value = (test_document_id,)
+
+    assert get_document_by_hash("abc") == test_document_id
+    assert get_document_by_hash("abc") == test_document_id
+    assert mock_cursor.execute.call_count == 1
+
+    mock_cursor.fetchone.return_value = None
+    assert get_document_by_hash("missing") is None
+    assert get_document_by_hash("missing") is None
+    assert mock_cursor.execute.call_count == 3
+
+    # A deleted document must not be reported as an existing duplicate
+    mock_cursor.rowcount = 1
+    delete_document_by_id(test_document_id)
+    assert get_document_by_hash("abc") is None
+
+
+def test_index_chunks_returns_existing_duplicate(mock_cursor, test_document_id):
+    """
+    Test a duplicate found during embedding is not inserted again.
+
+    Verifies:
+    - The existing document ID is returned with 0 chunks indexed
+    - No insert or COPY is issued for the duplicate
+    """
+    mock_cursor.fetchone.return_value = (test_document_id,)
+
+    with (
+        patch("app.infra.database.queries.get_embedding_function"),
+        patch("app.infra.database.queries.batch_embed", return_value=[[0.1]]),
+    ):
+        result = index_chunks("a.pdf", "pdf", 10, "hash", [Document(page_content="a")])
+
+    assert result == (test_document_id, 0)
+    assert mock_cursor.execute.call_count == 1
+    mock_cursor.copy.assert_not_called()
@@ -1,10 +1,42 @@
 """Unit tests for token bucket rate limiting middleware."""
 
 import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock, patch
 
-from fastapi import Request
+import fakeredis
+import pytest
+from fastapi import HTTPException, Request
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
-from app.core.ratelimit import buckets, rate_limit
+from app.core.ratelimit import (
+    DEFAULT_RATE_LIMIT,
+    NS_PER_SECOND,
+    TOKEN_BUCKET_LUA,
+    rate_limit,
+    take_local_token,
+    take_token,
+)
+
+
+@pytest.fixture
+def buckets():
+    """Give each test its own empty in-process bucket map."""
+    with patch("app.core.ratelimit.buckets", OrderedDict()) as isolated:
+        yield isolated
+
+
+# Minimal ASGI scope shared by the middleware tests, built once per module
+_SCOPE = {
+    "type": "http",
+    "client": ("127.0.0.1", 123),
+    "path": "/test",
+    "method": "GET",
+    "headers": [],
+    "query_string": b"",
+    "server": ("testserver", 80),
+    "scheme": "http",
+}
 
 
 class DummyCallNext:
@@ -28,7 +60,7 @@ class DummyCallNext:
         return "OK"
 
 
-def test_rate_limit_allows_initial_requests():
+def test_rate_limit_allows_initial_requests(buckets):
     """
     Test rate limiter allows requests within limit.
 
@@ -48,22 +80,8 @@ def test_rate_limit_allows_initial_requests():
     # Use localhost IP for testing
     ip = "127.0.0.1"
 
-    # Clear any existing rate limit buckets
-    buckets.clear()
-
-    # Create mock request from test IP with required ASGI scope keys
-    request = Request(
-        {
-            "type": "http",
-            "client": (ip, 123),
-            "path": "/test",
-            "method": "GET",
-            "headers": [],
-            "query_string": b"",
-            "server": ("testserver", 80),
-            "scheme": "http",
-        }
-    )
+    # Create mock request from test IP
+    request = Request({**_SCOPE, "client": (ip, 123)})
 
     # Create mock call_next function
     call_next = DummyCallNext()
@@ -73,3 +91,190 @@ def test_rate_limit_allows_initial_requests():
 
     # Verify request was allowed through
     assert result == "OK"
+
+
+def test_rate_limit_rejects_when_bucket_is_empty(buckets):
+    """
+    Test rate limiter rejects requests once the bucket is exhausted.
+
+    Verifies:
+    - Requests up to the configured limit are allowed
+    - The next request raises a 429 HTTPException
+    - The error detail includes the rate limit error code
+
+    The "/test" path falls back to the default rate limit, so the
+    bucket holds RATE_LIMIT_DEFAULT tokens before rejecting.
+    """
+    # Use a dedicated IP so the bucket starts full
+    ip = "10.0.0.1"
+
+    request = Request({**_SCOPE, "client": (ip, 123)})
+    call_next = DummyCallNext()
+
+    # Drain the bucket
+    for _ in range(DEFAULT_RATE_LIMIT):
+        assert asyncio.run(rate_limit(request, call_next)) == "OK"
+
+    # Verify the next request is rejected
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(rate_limit(request, call_next))
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail["code"] == "RATE_LIMIT_EXCEEDED"
+
+
+def test_rate_limit_uses_shared_bucket_when_configured(buckets):
+    """
+    Test rate limiter defers to the Redis token bucket when configured.
+
+    Verifies:
+    - The shared bucket decides whether the request is allowed
+    - A rejected request raises a 429 HTTPException
+    - In-process buckets are not touched
+
+    Redis keeps a single bucket per client across all workers, so
+    limits are not multiplied by the number of processes.
+    """
+    request = Request({**_SCOPE, "client": ("10.0.0.2", 123)})
+
+    # Simulate an exhausted shared bucket
+    shared_bucket = AsyncMock(return_value=0)
+
+    with patch("app.core.ratelimit.token_bucket", shared_bucket):
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(rate_limit(request, DummyCallNext()))
+
+    assert exc_info.value.status_code == 429
+    shared_bucket.assert_awaited_once()
+    assert len(buckets) == 0
+
+
+def test_rate_limit_evicts_least_recently_used_bucket(buckets):
+    """
+    Test rate limiter evicts the least recently used bucket at capacity.
+
+    Verifies:
+    - Bucket count never exceeds MAX_BUCKETS
+    - The least recently used bucket is evicted first
+    - Recently used buckets are kept
+
+    Bounding the bucket map prevents unbounded memory growth when
+    clients spoof many source addresses.
+    """
+    with patch("app.core.ratelimit.MAX_BUCKETS", 2):
+        take_local_token("10.0.0.3", "/test", 0, 5, 60)
+        take_local_token("10.0.0.4", "/test", 0, 5, 60)
+
+        # Touch the first bucket so the second becomes least recently used
+        take_local_token("10.0.0.3", "/test", 1 * NS_PER_SECOND, 5, 60)
+        take_local_token("10.0.0.5", "/test", 2 * NS_PER_SECOND, 5, 60)
+
+    assert len(buckets) == 2
+    assert ("10.0.0.3", "/test") in buckets
+    assert ("10.0.0.4", "/test") not in buckets
+
+
+def test_take_local_token_refills_over_time(buckets):
+    """
+    Test in-process buckets refill at limit / window tokens per second.
+
+    Verifies:
+    - A burst of requests up to the limit is allowed
+    - The next request in the same instant is rejected
+    - Waiting one refill interval allows exactly one more request
+    """
+    limit, window = 5, 10
+
+    for _ in range(limit):
+        assert take_local_token("10.0.0.6", "/test", 0, limit, window)
+    assert not take_local_token("10.0.0.6", "/test", 0, limit, window)
+
+    # One token refills every window / limit seconds, and not a nanosecond earlier
+    later = 2 * NS_PER_SECOND
+    assert not take_local_token("10.0.0.6", "/test", later - 1, limit, window)
+    assert take_local_token("10.0.0.6", "/test", later, limit, window)
+    assert not take_local_token("10.0.0.6", "/test", later, limit, window)
+
+
+def _run_lua(*calls):
+    """Run token bucket calls against an in-memory Redis with Lua support."""
+    server = fakeredis.aioredis.FakeRedis()
+    script = server.register_script(TOKEN_BUCKET_LUA)
+
+    async def scenario():
+        results = []
+        for setup, limit, window in calls:
+            if setup:
+                await setup(server)
+            results.append(await script(keys=["rl:test"], args=[limit, window]))
+        tokens = float(await server.hget("rl:test", "tokens"))
+        ttl = await server.ttl("rl:test")
+        return results, tokens, ttl
+
+    return asyncio.run(scenario())
+
+
+def _seed(tokens, age):
+    """Store a bucket last updated age seconds ago on the Redis clock."""
+
+    async def setup(server):
+        seconds, micros = await server.time()
+        now = seconds + micros / 1_000_000
+        await server.hset("rl:test", mapping={"tokens": tokens, "timestamp": now - age})
+
+    return setup
+
+
+def test_token_bucket_script_drains_and_expires():
+    """
+    Test the Redis token bucket script consumes tokens and sets a TTL.
+
+    Verifies:
+    - A new bucket starts full and allows up to the limit
+    - The next request is rejected once the bucket is empty
+    - The key expires after twice the window
+    """
+    results, tokens, ttl = _run_lua(*[(None, 2, 60)] * 3)
+
+    assert results == [1, 1, 0]
+    assert tokens < 1
+    assert ttl == 120
+
+
+def test_token_bucket_script_refills_and_clamps():
+    """
+    Test the Redis token bucket script refills over time up to the limit.
+
+    Verifies:
+    - An empty bucket allows a request after one refill interval
+    - A long idle bucket is clamped to the limit instead of overflowing
+    """
+    # One token refills every window / limit = 10 seconds
+    results, _, _ = _run_lua((_seed(0, 11), 6, 60))
+    assert results == [1]
+
+    results, tokens, _ = _run_lua((_seed(0, 10_000), 6, 60))
+    assert results == [1]
+    assert tokens == pytest.approx(5)
+
+
+def test_take_token_logs_redis_outage_once(buckets):
+    """
+    Test a Redis outage is logged once and requests fall back locally.
+
+    Verifies:
+    - Requests are still allowed from in-process buckets
+    - Only the first failure in an outage logs a warning
+    """
+    failing = AsyncMock(side_effect=RedisTimeoutError("stalled"))
+
+    with (
+        patch("app.core.ratelimit.token_bucket", failing),
+        patch("app.core.ratelimit._redis_down", False),
+        patch("app.core.ratelimit.logger") as mock_logger,
+    ):
+        assert asyncio.run(take_token("10.0.0.7", "/test"))
+        assert asyncio.run(take_token("10.0.0.7", "/test"))
+
+    assert failing.await_count == 2
+    mock_logger.warning.assert_called_once()
@@ -0,0 +1,125 @@
+"""Unit tests for retrieval helpers."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+from app.domain.rag.retrieval import (
+    Chunk,
+    _embed_query_cached,
+    build_context,
+    build_context_into,
+    extract_sources,
+    hybrid_search,
+)
+from app.domain.rag.streaming import format_sources
+
+
+def test_query_embeddings_are_cached():
+    """
+    Test repeated queries reuse the cached embedding.
+
+    Verifies:
+    - The embedding provider is called once per distinct query
+    - Cached embeddings are returned as immutable tuples
+
+    Users frequently re-send the same question, so a cache hit
+    skips the round-trip to the embedding model entirely.
+    """
+    model = MagicMock()
+    model.embed_query.return_value = [0.1, 0.2, 0.3]
+    _embed_query_cached.cache_clear()
+
+    with patch("app.domain.rag.retrieval.get_embedding_function", return_value=model):
+        first = _embed_query_cached("What is RAG?")
+        second = _embed_query_cached("What is RAG?")
+        _embed_query_cached("Something else")
+
+    _embed_query_cached.cache_clear()
+
+    assert first == second == (0.1, 0.2, 0.3)
+    assert model.embed_query.call_count == 2
+
+
+def _chunk(chunk_id: str) -> Chunk:
+    """Build a retrieved chunk with the given id."""
+    return Chunk(page_content=f"content {chunk_id}", metadata={"id": chunk_id})
+
+
+def test_hybrid_search_fuses_rankings():
+    """
+    Test hybrid search merges both result lists with Reciprocal Rank Fusion.
+
+    Verifies:
+    - Chunks found by both searches rank above single-list matches
+    - Lexical-only matches are kept instead of being dropped
+    - Results are capped at k and contain no duplicates
+    """
+    semantic = [_chunk("a"), _chunk("b"), _chunk("c")]
+    lexical = [_chunk("d"), _chunk("b")]
+
+    with (
+        patch("app.domain.rag.retrieval.semantic_search", return_value=semantic),
+        patch("app.domain.rag.retrieval.lexical_search", return_value=lexical),
+    ):
+        results = hybrid_search("query", k=3)
+
+    ids = [doc.metadata["id"] for doc in results]
+
+    # "b" appears in both lists, "a" and "d" each lead one list
+    assert ids[0] == "b"
+    assert set(ids[1:]) == {"a", "d"}
+
+
+def test_build_context_separates_numbered_chunks():
+    """
+    Test chunks are numbered and separated in the context string.
+
+    Verifies:
+    - Each chunk is prefixed with its 1-based marker
+    - Separators appear only between chunks
+    - An empty chunk list produces an empty context
+    """
+    context = build_context([_chunk("a"), _chunk("b")])
+
+    assert context == "[Chunk 1]\ncontent a\n\n---\n\n[Chunk 2]\ncontent b"
+    assert build_context([]) == ""
+
+
+def test_build_context_into_consumes_lazy_chunks():
+    """
+    Test chunks can be streamed into the context buffer from a generator.
+
+    Verifies:
+    - Chunks are consumed from a generator without a list
+    - The returned count matches the number of chunks written
+    """
+    buf = io.StringIO()
+
+    count = build_context_into(buf, (_chunk(c) for c in "abc"))
+
+    assert count == 3
+    assert buf.getvalue().count("[Chunk ") == 3
+    assert build_context_into(io.StringIO(), iter(())) == 0
+
+
+def test_extract_sources_returns_formatted_tuples():
+    """
+    Test sources are reduced to filename, page and chunk index once.
+
+    Verifies:
+    - Paths are reduced to their basename
+    - Missing or invalid values fall back to defaults
+    - format_sources joins the tuples without re-parsing them
+    """
+    chunks = [
+        Chunk(
+            page_content="a",
+            metadata={"source": "/data/doc.pdf", "page": "2", "chunkIndex": 1},
+        ),
+        Chunk(page_content="b", metadata={"page": "n/a"}),
+    ]
+
+    sources = extract_sources(chunks)
+
+    assert sources == [("doc.pdf", 2, 1), ("unknown", 0, 0)]
+    assert format_sources(sources) == "doc.pdf:2:1, unknown:0:0"
@@ -0,0 +1,34 @@
+"""Unit tests for upload filename sanitization."""
+
+from app.domain.uploads.processor import sanitize_filename
+
+
+def test_sanitize_filename_neutralizes_paths():
+    """
+    Test path components are stripped from uploaded filenames.
+
+    Verifies:
+    - Parent directory references are removed
+    - Forward and backward slashes become underscores
+    - Surrounding whitespace is trimmed
+
+    Uploaded names are joined onto the data directory, so they
+    must never be able to escape it.
+    """
+    assert sanitize_filename("../../etc/passwd") == "__etc_passwd"
+    assert sanitize_filename("..\\windows\\file.pdf") == "_windows_file.pdf"
+    assert sanitize_filename("  report.pdf  ") == "report.pdf"
+
+
+def test_sanitize_filename_removes_unsafe_characters():
+    """
+    Test characters outside the safe set are dropped.
+
+    Verifies:
+    - Shell and markup characters are removed
+    - Word characters, spaces, dots and dashes are kept
+    - Names are truncated to 255 characters
+    """
+    assert sanitize_filename("my <report>; v2.pdf") == "my report v2.pdf"
+    assert sanitize_filename("résumé-final.pdf") == "résumé-final.pdf"
+    assert len(sanitize_filename("a" * 300 + ".pdf")) == 255
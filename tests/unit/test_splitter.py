@@ -0,0 +1,42 @@
+"""Unit tests for adaptive document splitting."""
+
+from langchain_core.documents import Document
+
+from app.domain.documents.splitter import get_splitter, split_documents
+
+
+def test_get_splitter_is_cached():
+    """
+    Test splitter instances are reused per chunk size and overlap.
+
+    Verifies:
+    - Same size and overlap return the same splitter instance
+    - Different sizes return different instances
+    """
+    assert get_splitter(800, 200) is get_splitter(800, 200)
+    assert get_splitter(800, 200) is not get_splitter(480, 200)
+
+
+def test_split_documents_filters_and_splits():
+    """
+    Test document splitting filters short documents and splits long ones.
+
+    Verifies:
+    - Documents shorter than min_chars are dropped
+    - Short documents are kept as a single chunk
+    - Long documents are split into multiple chunks
+    - Chunk metadata is preserved from the source document
+    """
+    short = Document(page_content="tiny", metadata={"page": 1})
+    medium = Document(page_content="word " * 40, metadata={"page": 2})
+    long = Document(page_content="sentence here. " * 1000, metadata={"page": 3})
+
+    chunks = split_documents([short, medium, long], min_chars=100)
+
+    # Verify short document was filtered and medium kept whole
+    assert chunks[0].page_content == medium.page_content.strip()
+
+    # Verify long document was split with metadata preserved
+    rest = chunks[1:]
+    assert len(rest) > 1
+    assert all(c.metadata["page"] == 3 for c in rest)